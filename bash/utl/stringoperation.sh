@@ -25,50 +25,38 @@ function replace_tablecolumn_by_mappingdatabase(){
 		sourcedata=`cat -`
 	fi
 
-	awkprocess=$(
-		echo "$mapdata" |
-			awk -v delimiter="$mapdelimiter" \
-				-v cn="$columnnum" \
-				-v dv="$defaultvalue" \
-				'BEGIN  {
-					FS="["delimiter"]"; OFS=delimiter; # set delimiter
-					print "{"
-					printf "switch($%s){\n", cn
-				}
-				(NF==2){
-					# $1 = match pattern
-					# $2 = string after replacement
-					printf "case \"%s\":\n", $1
-
-					if($2 ~ /^".+"$/){
-						# If the string is enclosed in double quotes,
-						# avoid enclosing it in double quotes.
-						printf "$%s=%s; break\n", cn, $2
-					}else{
-						# If the string contains double quotes, escape them.
-						gsub("\"","\\\"")
-						printf "$%s=\"%s\"; break\n", cn, $2
+	# load the map database into a hash table once and replace in a single pass
+	echo "$sourcedata" |
+		awk -v sourcedelimiter="${sourcedelimiter}" \
+			-v mapdelimiter="${mapdelimiter}" \
+			-v cn="$columnnum" \
+			-v dv="$defaultvalue" \
+			'BEGIN{
+				OFS=sourcedelimiter
+			}
+			NR == FNR {
+				# map database (echo always prints at least one line)
+				# $1 = match pattern
+				# $2 = string after replacement
+				if(NF == 2 && !($1 in map)){
+					value = $2
+					if(value ~ /^".+"$/){
+						# If the string is enclosed in double quotes, remove them.
+						value = substr(value, 2, length(value)-2)
 					}
+					map[$1] = value
 				}
-				END {
+				next
+			}
+			{
+				if($cn in map){
+					$cn = map[$cn]
+				}else if(dv != "-"){
 					# set the default value
-					print "default:"
-					if(dv=="-"){
-						print "break"
-					}else{
-						printf "$%s=\"%s\"\n", cn, dv
-					}
-					print "}" # end of switch
-					print "print $0"
-					print "}"
-				}'
-	)
-
-	echo "$sourcedata" |
-		awk -v delimiter="${sourcedelimiter}" \
-			'BEGIN {
-				FS="["delimiter"]"; OFS=delimiter; # set delimiter
-			}'"$awkprocess" # perform replacement
+					$cn = dv
+				}
+				print $0
+			}' FS="[${mapdelimiter}]" <(echo "$mapdata") FS="[${sourcedelimiter}]" -
 }
 
 function replace_char_in_tablecolumn_with_char(){
@@ -15,20 +15,10 @@ class GTOBasis:
         self.__exponents = np.array(exponents)
         # 規格化定数
         self.__normalizes = np.power(2, l+m+n) * \
-                                np.power(self.__factorial2(2*l-1)*self.__factorial2(2*m-1)*self.__factorial2(2*n-1), -1/2) * \
+                                np.power(_factorial2(2*l-1)*_factorial2(2*m-1)*_factorial2(2*n-1), -1/2) * \
                                 np.power(2/np.pi, 3/4) * \
                                 np.power(exponents, (2*(l+m+n)+3)/4)
 
-    def __factorial2(self, n):
-        if n < 0:
-            return (-1)**((n-1)/2) * n / self.__factorial2(-n)
-        k = n // 2 + n % 2
-        if n % 2 == 0:
-            # 偶数の場合
-            return 2**k * np.math.factorial(k)
-        else:
-            return np.math.factorial(2*k)/(2**k * np.math.factorial(k))
-
     def calc(self, r):
         """
         r: 基底関数の値を計算する座標(単位: Bohr): np.ndarray or list: shape: (3,) or shape: (*,3)
@@ -41,3 +31,306 @@ class GTOBasis:
                         np.exp((-1)*self.__exponents*np.linalg.norm(_r,axis=1)[:,np.newaxis]**2),
                     axis=1
                 )
+
+
+def _factorial2(n):
+    """
+    二重階乗 n!! (n >= -1)
+    """
+    result = 1
+    for k in range(n, 0, -2):
+        result *= k
+    return result
+
+
+# Gaussianでの各shell typeのCartesian成分の(l,m,n)の並び
+_cartesianPowers = {
+    0: [[0,0,0]],
+    1: [[1,0,0],[0,1,0],[0,0,1]],
+    2: [[2,0,0],[0,2,0],[0,0,2],[1,1,0],[1,0,1],[0,1,1]],
+    # XXX,YYY,ZZZ,XYY,XXY,XXZ,XZZ,YZZ,YYZ,XYZ
+    3: [[3,0,0],[0,3,0],[0,0,3],[1,2,0],[2,1,0],[2,0,1],[1,0,2],[0,1,2],[0,2,1],[1,1,1]],
+    # ZZZZ,YZZZ,YYZZ,YYYZ,YYYY,XZZZ,XYZZ,XYYZ,XYYY,XXZZ,XXYZ,XXYY,XXXZ,XXXY,XXXX
+    4: [[0,0,4],[0,1,3],[0,2,2],[0,3,1],[0,4,0],[1,0,3],[1,1,2],[1,2,1],[1,3,0],[2,0,2],[2,1,1],[2,2,0],[3,0,1],[3,1,0],[4,0,0]],
+}
+
+
+def _giveSolidHarmonics(L):
+    """
+    実数の正則立体調和関数(Racah規格化)を単項式の多項式として返す
+    (Helgaker, Molecular Electronic-Structure Theory, 6.4.70-6.4.73の漸化式)
+
+    return: {m: {(l,m,n): 係数}} (m = -L, ..., L)
+    """
+    def add(p, q, a=1.0, b=1.0):
+        result = {k: a*v for k, v in p.items()}
+        for k, v in q.items():
+            result[k] = result.get(k, 0.0) + b*v
+        return result
+
+    def mul(p, lmn):
+        return {(k[0]+lmn[0], k[1]+lmn[1], k[2]+lmn[2]): v for k, v in p.items()}
+
+    x, y, z = (1,0,0), (0,1,0), (0,0,1)
+    def mulr2(p):
+        return add(add(mul(p, (2,0,0)), mul(p, (0,2,0))), mul(p, (0,0,2)))
+
+    # S[l][m]
+    S = [{0: {(0,0,0): 1.0}}]
+    for l in range(L):
+        Snext = {}
+        factor = np.sqrt((2 if l == 0 else 1) * (2*l+1) / (2*l+2))
+        sign = 0.0 if l == 0 else 1.0
+        Snext[l+1] = add(mul(S[l][l], x), mul(S[l][-l], y), factor, -factor*sign)
+        Snext[-l-1] = add(mul(S[l][l], y), mul(S[l][-l], x), factor, factor*sign)
+        for m in range(-l, l+1):
+            p = mul(S[l][m], z)
+            if abs(m) <= l-1:
+                Snext[m] = add(p, mulr2(S[l-1][m]), (2*l+1)/np.sqrt((l+m+1)*(l-m+1)), -np.sqrt((l+m)*(l-m))/np.sqrt((l+m+1)*(l-m+1)))
+            else:
+                Snext[m] = {k: (2*l+1)*v/np.sqrt((l+m+1)*(l-m+1)) for k, v in p.items()}
+        S.append(Snext)
+
+    return S[L]
+
+
+# 角運動量毎の、Cartesian成分から球面調和(pure)成分への変換行列
+_pureTransformCache = {}
+
+def _givePureTransform(L):
+    """
+    Cartesian成分(_cartesianPowers[L]の並び)からpure成分への変換行列を返す
+    pure成分の並びはGaussianと同じ m = 0, +1, -1, +2, -2, ...
+    x^L型の原始関数の規格化定数を共通にかけるので、ここで1/sqrt((2L-1)!!)を含める
+
+    return: np.ndarray: shape: (2L+1, numCartesian)
+    """
+    if L not in _pureTransformCache.keys():
+        solidHarmonics = _giveSolidHarmonics(L)
+        powers = [tuple(lmn) for lmn in _cartesianPowers[L]]
+        mList = [0] + [sm for m in range(1, L+1) for sm in [m, -m]]
+        transform = np.array([[solidHarmonics[m].get(lmn, 0.0) for lmn in powers] for m in mList])
+        transform[np.abs(transform) < 1e-14] = 0.0
+        _pureTransformCache[L] = transform / np.sqrt(_factorial2(2*L-1))
+    return _pureTransformCache[L]
+
+
+def _giveAngularTransform(shellType):
+    """
+    shell typeに対応する(Cartesian成分の次数, 変換行列)を返す
+    変換行列は 角度部分 = 変換行列 @ [x^l y^m z^n, ...] となるもの(原始関数の規格化定数のうち成分に依存する部分を含む)
+    return: (np.ndarray: shape: (numCartesian, 3), np.ndarray: shape: (numFunc, numCartesian))
+    """
+    L = abs(shellType)
+    if L not in _cartesianPowers.keys():
+        raise ValueError('shell type:{} is not supported'.format(shellType))
+    powers = np.array(_cartesianPowers[L])
+    if shellType >= 0 or L <= 1:
+        transform = np.diag([1/np.sqrt(np.prod([_factorial2(2*p-1) for p in lmn])) for lmn in powers])
+    else:
+        transform = _givePureTransform(L)
+    return powers, transform
+
+
+class BasisSet:
+    """
+    fchkのshell情報から全ての基底関数を一括で評価するクラス
+
+    同じshellに属する基底関数は動径部分を共有するので、
+    動径部分はshell毎に1回だけ計算し、角度部分はshell typeが同じshellをまとめて計算する
+    Cartesian(shell type: 0~4), pure(shell type: -2~-4)のshellに対応しており、
+    pureのshellはCartesian成分の値に変換行列をかけて計算する
+    """
+    def __init__(self, shellTypes, numPrimitives, exponents, contractions, SPcontractions, shellCoords):
+        """
+        shellTypes: shell type (len == numShell)
+        numPrimitives: 各shellの原始関数の数 (len == numShell)
+        exponents: 原始関数の指数 (len == numPrimitive)
+        contractions: 縮約係数 (len == numPrimitive)
+        SPcontractions: SP shellのP成分の縮約係数 (len == numPrimitive) or None
+        shellCoords: 各shellの中心座標(単位: Bohr) (shape: (numShell, 3))
+        """
+        shellTypes = np.asarray(shellTypes)
+        numPrimitives = np.asarray(numPrimitives)
+        exponents = np.asarray(exponents, dtype=np.float64)
+        contractions = np.asarray(contractions, dtype=np.float64)
+        if SPcontractions is None:
+            SPcontractions = np.zeros_like(contractions)
+        SPcontractions = np.asarray(SPcontractions, dtype=np.float64)
+        shellCoords = np.asarray(shellCoords, dtype=np.float64).reshape(-1,3)
+
+        # SP shellはS成分とP成分の2つに分けて扱う(以下、分けたものをsubshellと呼ぶ)
+        # subshell毎に: 中心座標, 角運動量の種類(shell type), 最初の基底関数の番号, 原始関数の範囲
+        primStart = np.append(0, np.cumsum(numPrimitives))[:-1]
+        subCoords = []
+        subTypes = []
+        subOffsets = []
+        subPrimIndex = []
+        subContractions = []
+        offset = 0
+        for st, coord, start, num in zip(shellTypes, shellCoords, primStart, numPrimitives):
+            primIndex = np.arange(start, start+num)
+            if st == -1:
+                parts = [(0, offset, contractions), (1, offset+1, SPcontractions)]
+                offset += 4
+            else:
+                parts = [(st, offset, contractions)]
+                offset += len(_giveAngularTransform(st)[1])
+            for subType, subOffset, c in parts:
+                subCoords.append(coord)
+                subTypes.append(subType)
+                subOffsets.append(subOffset)
+                subPrimIndex.append(primIndex)
+                subContractions.append(c[primIndex])
+
+        self.__numBasis = offset
+        self.__subCoords = np.array(subCoords).reshape(-1,3)       # shape: (numSubshell, 3)
+        subTypes = np.array(subTypes, dtype=np.int64)              # shape: (numSubshell,)
+        subOffsets = np.array(subOffsets, dtype=np.int64)          # shape: (numSubshell,)
+        self.__subL = np.abs(subTypes)                             # 角運動量 shape: (numSubshell,)
+        self.__subNumPrim = np.array([len(p) for p in subPrimIndex], dtype=np.int64)
+
+        # 原始関数毎の指数と係数(規格化定数のうち指数に依存する部分を含める)
+        # 規格化定数: 2^L (2/pi)^(3/4) alpha^((2L+3)/4) / sqrt((2l-1)!!(2m-1)!!(2n-1)!!)
+        self.__primSubIndex = np.repeat(np.arange(len(subPrimIndex)), self.__subNumPrim) # shape: (numSubPrimitive,)
+        self.__primExponents = exponents[np.concatenate(subPrimIndex)]                   # shape: (numSubPrimitive,)
+        primL = self.__subL[self.__primSubIndex]
+        self.__primCoeffs = np.concatenate(subContractions) * \
+                                np.power(2.0, primL) * np.power(2/np.pi, 3/4) * \
+                                np.power(self.__primExponents, (2*primL+3)/4)
+
+        # shell type毎にsubshellをまとめ、角度部分の変換行列を用意する
+        # groups: [(subshellのindex, 基底関数の番号(shape: (numFunc, numSubshellInGroup)), Cartesian成分の次数, 変換行列), ...]
+        self.__groups = []
+        subNumFunc = np.zeros(len(subTypes), dtype=np.int64)
+        subAngularBound = np.zeros(len(subTypes))
+        for st in np.unique(subTypes):
+            subIndex = np.where(subTypes == st)[0]
+            powers, transform = _giveAngularTransform(st)
+            basisIndex = subOffsets[subIndex][np.newaxis,:] + np.arange(len(transform))[:,np.newaxis]
+            self.__groups.append((subIndex, basisIndex, powers, transform))
+            subNumFunc[subIndex] = len(transform)
+            # |x^l y^m z^n| <= |r|^L なので、角度部分の絶対値の上限は変換行列の行の絶対値和の最大値 * |r|^L
+            subAngularBound[subIndex] = np.max(np.sum(np.abs(transform), axis=1))
+
+        # 基底関数はsubshellの順に連続して並んでいる
+        self.__basisSubIndex = np.repeat(np.arange(len(subTypes)), subNumFunc) # shape: (numBasis,)
+        self.__subBasisStart = subOffsets
+        self.__subAngularBound = subAngularBound
+
+    def giveNumBasis(self):
+        """
+        基底関数の総数
+        """
+        return self.__numBasis
+
+    def __calcSubshells(self, r, subMask):
+        """
+        subMaskで選択したsubshellに属する基底関数の値を計算
+        r: np.ndarray: shape: (numPoint, 3)
+        subMask: np.ndarray(bool): shape: (numSubshell,)
+        return: (np.ndarray: shape: (numSelectedBasis, numPoint), 選択された基底関数のmask: shape: (numBasis,))
+        """
+        basisMask = subMask[self.__basisSubIndex]
+        result = np.empty((np.count_nonzero(basisMask), len(r)))
+        subSelected = np.where(subMask)[0]
+        if len(subSelected) == 0:
+            return result, basisMask
+
+        # 選択されたsubshell, 基底関数の中での位置
+        subPos = np.full(len(subMask), -1)
+        subPos[subSelected] = np.arange(len(subSelected))
+        basisPos = np.cumsum(basisMask) - 1
+
+        # subshellの中心からの相対座標
+        dr = r[np.newaxis,:,:] - self.__subCoords[subSelected][:,np.newaxis,:]  # shape: (numSelectedSubshell, numPoint, 3)
+        r2 = np.einsum('spi,spi->sp', dr, dr)                                   # shape: (numSelectedSubshell, numPoint)
+
+        # 動径部分: subshell毎に原始関数の和をとる
+        primMask = subMask[self.__primSubIndex]
+        primValue = self.__primCoeffs[primMask][:,np.newaxis] * \
+                        np.exp(-self.__primExponents[primMask][:,np.newaxis] * r2[subPos[self.__primSubIndex[primMask]]])
+        primStart = np.append(0, np.cumsum(self.__subNumPrim[subSelected]))[:-1]
+        radial = np.add.reduceat(primValue, primStart, axis=0) # shape: (numSelectedSubshell, numPoint)
+
+        # 角度部分: shell type毎にまとめて計算
+        for subIndex, basisIndex, powers, transform in self.__groups:
+            isSelected = subMask[subIndex]
+            if not np.any(isSelected):
+                continue
+            pos = subPos[subIndex[isSelected]]
+            _dr = dr[pos]                                       # shape: (numSubshellInGroup, numPoint, 3)
+            maxPower = np.max(powers)
+            # x^k, y^k, z^k (k = 0, 1, ..., maxPower)
+            drPowers = np.power(_dr[np.newaxis], np.arange(maxPower+1)[:,np.newaxis,np.newaxis,np.newaxis]) # shape: (maxPower+1, numSubshellInGroup, numPoint, 3)
+            monomials = drPowers[powers[:,0],:,:,0] * drPowers[powers[:,1],:,:,1] * drPowers[powers[:,2],:,:,2] # shape: (numCartesian, numSubshellInGroup, numPoint)
+            angular = np.tensordot(transform, monomials, axes=1) # shape: (numFunc, numSubshellInGroup, numPoint)
+            result[basisPos[basisIndex[:,isSelected]]] = angular * radial[pos][np.newaxis]
+
+        return result, basisMask
+
+    def calc(self, r):
+        """
+        全ての基底関数の値を計算
+        r: 基底関数の値を計算する座標(単位: Bohr): np.ndarray or list: shape: (3,) or shape: (*,3)
+        return: np.ndarray: shape: (numBasis, numPoint)
+        """
+        r = np.asarray(r, dtype=np.float64).reshape(-1,3)
+        result, _ = self.__calcSubshells(r, np.ones(len(self.__subCoords), dtype=bool))
+        return result
+
+    def __giveSubshellBound(self, r):
+        """
+        座標rを囲む直方体の中での、各subshellの基底関数の絶対値の上限を返す
+        r: np.ndarray: shape: (numPoint, 3)
+        return: np.ndarray: shape: (numSubshell,)
+        """
+        lower = np.min(r, axis=0)
+        upper = np.max(r, axis=0)
+        # 直方体の中で最も近い点、最も遠い点までの距離
+        nearest2 = np.sum((np.clip(self.__subCoords, lower, upper) - self.__subCoords)**2, axis=1)
+        farthest = np.linalg.norm(np.maximum(np.abs(self.__subCoords-lower), np.abs(self.__subCoords-upper)), axis=1)
+
+        primBound = np.abs(self.__primCoeffs) * np.exp(-self.__primExponents * nearest2[self.__primSubIndex])
+        radialBound = np.add.reduceat(primBound, np.append(0, np.cumsum(self.__subNumPrim))[:-1])
+        return radialBound * np.power(farthest, self.__subL) * self.__subAngularBound
+
+    def calcDensity(self, r, densityMatrix, threshold=1e-10, chunkSize=4096):
+        """
+        密度行列から電子密度を計算
+        rho(r) = sum_{mu,nu} chi_mu(r) D_{mu,nu} chi_nu(r)
+
+        点をchunkSize毎に分けて計算し、各chunkの範囲で
+        |chi_mu| |D_{mu,nu}| |chi_nu| の上限がthreshold未満となるsubshellの組は計算から除く
+        (chunk内の点が空間的にまとまっているほど、大きな分子で除かれる組が多くなる)
+
+        r: 電子密度を計算する座標(単位: Bohr): np.ndarray or list: shape: (3,) or shape: (*,3)
+        densityMatrix: 密度行列: np.ndarray: shape: (numBasis, numBasis)
+        threshold: 除外の閾値 (0の場合は除外しない)
+        return: np.ndarray: shape: (numPoint,)
+        """
+        r = np.asarray(r, dtype=np.float64).reshape(-1,3)
+        densityMatrix = np.asarray(densityMatrix, dtype=np.float64)
+        if densityMatrix.shape != (self.__numBasis, self.__numBasis):
+            raise ValueError('shape of densityMatrix must be (numBasis, numBasis)')
+
+        # subshellの組毎の密度行列の絶対値の最大値
+        densityBound = np.maximum.reduceat(np.abs(densityMatrix), self.__subBasisStart, axis=0)
+        densityBound = np.maximum.reduceat(densityBound, self.__subBasisStart, axis=1) # shape: (numSubshell, numSubshell)
+
+        result = np.empty(len(r))
+        for start in range(0, len(r), chunkSize):
+            _r = r[start:start+chunkSize]
+
+            # 寄与が閾値を超えうるsubshellの組
+            bound = self.__giveSubshellBound(_r)
+            isSignificantPair = bound[:,np.newaxis] * densityBound * bound[np.newaxis,:] >= threshold
+            subMask = np.any(isSignificantPair, axis=1)
+
+            values, basisMask = self.__calcSubshells(_r, subMask) # shape: (numSelectedBasis, numPoint)
+            basisSubIndex = self.__basisSubIndex[basisMask]
+            _densityMatrix = densityMatrix[np.ix_(basisMask, basisMask)] * isSignificantPair[np.ix_(basisSubIndex, basisSubIndex)]
+
+            result[start:start+chunkSize] = np.einsum('mp,mp->p', values, _densityMatrix @ values)
+
+        return result
@@ -1,10 +1,24 @@
-import re
+import json
 import itertools
 import copy
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 import numpy as np
 from scipy.interpolate import RegularGridInterpolator
 
+def _giveNodeCoordBlock(startingPoint, stepVector, numGridPoint, start, stop):
+    """
+    格子の座標のうち、a方向の[start:stop]の部分を返す
+    return: np.ndarray (shape: (stop-start, nb, nc, 3))
+    """
+    na, nb, nc = numGridPoint
+    sv1, sv2, sv3 = stepVector
+    return startingPoint + \
+            np.arange(start, stop)[:,np.newaxis,np.newaxis,np.newaxis] * sv1 + \
+            np.arange(nb)[np.newaxis,:,np.newaxis,np.newaxis] * sv2 + \
+            np.arange(nc)[np.newaxis,np.newaxis,:,np.newaxis] * sv3
+
+
 class Cube:
     """
     gaussianのユーティリティcubegenが生成するcubeファイルを読み込むクラス
@@ -17,89 +31,134 @@ class Cube:
     def __init__(self, **args):
         if 'filePath' in args.keys():
             self.__init__fromFile(**args)
+        elif 'binaryFilePath' in args.keys():
+            self.__init__fromBinaryFile(**args)
         elif 'cubeData' in args.keys():
             self.__init__fromCubeData(**args)
         else:
-            raise ValueError('args must contain filePath or cubeData')
+            raise ValueError('args must contain filePath, binaryFilePath or cubeData')
+
 
+    def __init__fromFile(self, filePath=None, valueNames=None, memmapPath=None, blockSize=2**24):
+        """
+        cubeファイルを読み込む
 
-    def __init__fromFile(self, filePath=None, valueNames=None):
+        ヘッダー部分は1行ずつ解釈し、格子データ部分はblockSize(byte)毎にまとめて数値の配列に変換する
+        memmapPath: 指定した場合は格子データをこのファイルのnp.memmapに書き込む(メモリに載らない大きさのcube用)
+        """
         # 値チェック
         if filePath is None:
             raise ValueError('filePath is None')
 
         # ファイル読み込み
-        with open(filePath, mode='r') as f:
-            try:
-                data = [s.strip() for s in f.readlines()]
-            except UnicodeDecodeError as e:
-                # binaryではないか
-                print('Cube file, {} may be a binary file'.format(filePath))
-                print(e)
-                exit()
-
-
-        # ヘッダー行が存在するか
-        # 3行目に'E'が含まれていないかどうかで判別
-        if 'E' in data[2]:
-            raise IOError('Cube file, {} may not contain header'.format(filePath))
-
-        # 3行目からfloatの配列に変換
-        titleData = data[0:2]
-        numData = data[2:]
-        numData = [s for s in numData if s != '']      # 空行は除去
-        numData = [re.split(' +', s) for s in numData] # 数の二重リストに変形する
-        numData = [[float(s) for s in l] for l in numData]
-
-        # 結合
-        data = titleData + numData
-
-        # ヘッダー行が存在するか(2回目)
-        if len(numData[0]) == 6:
-            raise IOError('Cube file, {} may not contain header'.format(filePath))
-
-        # 単位
-        self.__unit = 'Bohr'
-        # 原子数
-        self.__numAtom = int(data[2][0])
-        # 格子点の基準点（開始位置）
-        self.__startingPoint = np.array(data[2][1:4])
-        # データの次元 (設定されてなければ1にする)
-        if len(data[2]) == 4:
-            valueDim = 1
-        else:
-            valueDim = int(data[2][4])
-
-        # 値の名前設定
-        # 先に初期化しておく
-        self.__valueDim = 0
-        self.__valueNames = None
-        # チェック
-        valueNames =  self.__checkValueNames(valueNames, valueDim)
-        self.__valueDim = valueDim
-        self.__valueNames = valueNames
-
-        # 格子のステップ数と単位ベクトル
-        # np.ndarray: [n1,n2,n3] (np.int32)
-        self.__numGridPoint = np.array([int(l[0]) for l in data[3:6]])
-        # np.ndarray: [[v1x,v1y,v1z], [v2x,v2y,v2z], [v3x,v3y,v3z]]
-        self.__stepVector = np.array([l[1:4] for l in data[3:6]])
-
-        # 原子番号、原子座標
-        # np.ndarray: shape: (numAtom,) (np.int32)
-        self.__atomicNumData = np.array([int(l[0]) for l in data[6:6+self.__numAtom]])
-        # np.ndarray: shape: (numAtom, 3)
-        self.__atomXYZData = np.array([[l[2],l[3],l[4]] for l in data[6:6+self.__numAtom]])
-
-        # cubeデータ取り出し
-        # 平坦化し、3次元の行列に変換
-        self.__cubeData = np.array(
-                            list(itertools.chain.from_iterable(data[6+self.__numAtom:]))
-                        ).reshape(*self.__numGridPoint,self.__valueDim)
+        with open(filePath, mode='rb') as f:
+            def readHeaderLine():
+                try:
+                    return f.readline().decode().strip()
+                except UnicodeDecodeError as e:
+                    # binaryではないか
+                    print('Cube file, {} may be a binary file'.format(filePath))
+                    print(e)
+                    exit()
+
+            titleData = [readHeaderLine(), readHeaderLine()]
+            line3 = readHeaderLine()
+
+            # ヘッダー行が存在するか
+            # 3行目に'E'が含まれていないかどうかで判別
+            if 'E' in line3:
+                raise IOError('Cube file, {} may not contain header'.format(filePath))
+            line3 = [float(s) for s in line3.split()]
+            # ヘッダー行が存在するか(2回目)
+            if len(line3) == 6:
+                raise IOError('Cube file, {} may not contain header'.format(filePath))
+
+            # 格子のステップ数と単位ベクトル
+            gridData = [[float(s) for s in readHeaderLine().split()] for _ in range(3)]
+            # 原子データ
+            # (原子数が負の場合は、原子データの後に{軌道の数} {軌道の番号}...の行がある)
+            numAtom = int(line3[0])
+            atomData = [[float(s) for s in readHeaderLine().split()] for _ in range(abs(numAtom))]
+            if numAtom < 0:
+                # 軌道の番号は複数行に折り返される(cubegenでは1行に10個まで)ので、{軌道の数}+1個揃うまで読む
+                orbitalLine = [int(s) for s in readHeaderLine().split()]
+                while len(orbitalLine) < orbitalLine[0] + 1:
+                    orbitalLine += [int(s) for s in readHeaderLine().split()]
+
+            # 単位
+            self.__unit = 'Bohr'
+            # 原子数
+            self.__numAtom = abs(numAtom)
+            # 格子点の基準点（開始位置）
+            self.__startingPoint = np.array(line3[1:4])
+            # データの次元 (設定されてなければ1にする)
+            if len(line3) > 4:
+                valueDim = int(line3[4])
+            elif numAtom < 0:
+                valueDim = orbitalLine[0]
+            else:
+                valueDim = 1
+
+            # 値の名前設定
+            # 先に初期化しておく
+            self.__valueDim = 0
+            self.__valueNames = None
+            # チェック
+            valueNames =  self.__checkValueNames(valueNames, valueDim)
+            self.__valueDim = valueDim
+            self.__valueNames = valueNames
+
+            # 格子のステップ数と単位ベクトル
+            # np.ndarray: [n1,n2,n3] (np.int32)
+            self.__numGridPoint = np.array([int(l[0]) for l in gridData])
+            # np.ndarray: [[v1x,v1y,v1z], [v2x,v2y,v2z], [v3x,v3y,v3z]]
+            self.__stepVector = np.array([l[1:4] for l in gridData])
+
+            # 原子番号、原子座標
+            # np.ndarray: shape: (numAtom,) (np.int32)
+            self.__atomicNumData = np.array([int(l[0]) for l in atomData], dtype=np.int64)
+            # np.ndarray: shape: (numAtom, 3)
+            self.__atomXYZData = np.array([[l[2],l[3],l[4]] for l in atomData]).reshape(-1,3)
+
+            # cubeデータ取り出し
+            # 残りの部分をblockSize毎に読み込み、空白区切りの数値としてまとめて変換する
+            shape = (*self.__numGridPoint, self.__valueDim)
+            if memmapPath is None:
+                cubeData = np.empty(shape)
+            else:
+                cubeData = np.memmap(memmapPath, dtype=np.float64, mode='w+', shape=shape)
+            flatData = cubeData.reshape(-1)
+            numValue = 0
+            remainder = b''
+            while True:
+                block = f.read(blockSize)
+                if block == b'':
+                    text = remainder
+                else:
+                    # 数値の途中で区切らないように、最後の空白文字以降は次のブロックに回す
+                    block = remainder + block
+                    cut = max(block.rfind(b' '), block.rfind(b'\n')) + 1
+                    text, remainder = block[:cut], block[cut:]
+                values = np.fromstring(text.decode(), dtype=np.float64, sep=' ')
+                if numValue + len(values) > len(flatData):
+                    raise IOError('Cube file, {} contains more values than the header indicates'.format(filePath))
+                flatData[numValue:numValue+len(values)] = values
+                numValue += len(values)
+                if block == b'':
+                    break
+            if numValue != len(flatData):
+                raise IOError('Cube file, {} contains {} values but the header indicates {}'.format(filePath, numValue, len(flatData)))
+
+            self.__cubeData = cubeData
+            # addCubeDataで値を追加するためのバッファ (最初の追加時に確保する)
+            self.__cubeBuffer = None
 
         # contourデータ保持
         self.__contourList = []
 
+        # 補間用のキャッシュ
+        self.__resetCache()
+
     def __init__fromCubeData(self, startingPoint=None, stepVector=None, numGridPoint=None, cubeData=None, valueDim=1, valueNames=None, atomicNumData=None, atomXYZData=None, unit='Bohr'):
         """
         格子データが既に存在する場合に利用する
@@ -189,6 +248,8 @@ class Cube:
         self.__numGridPoint = numGridPoint
         self.__unit = unit
         self.__cubeData = cubeData
+        # addCubeDataで値を追加するためのバッファ (最初の追加時に確保する)
+        self.__cubeBuffer = None
 
         # 値の名前設定
         # 先に初期化しておく
@@ -236,6 +297,78 @@ class Cube:
             self.__atomicNumData = None
             self.__atomXYZData = None
 
+        # 補間用のキャッシュ
+        self.__resetCache()
+
+    def __resetCache(self):
+        """
+        補間用のキャッシュ(格子ベクトルの逆行列、補間関数)を破棄する
+        cubeData, stepVector, startingPointを変更した場合は必ず呼ぶこと
+        """
+        self.__stepVectorInv = None
+        self.__interpolatorDict = {}
+
+    def __init__fromBinaryFile(self, binaryFilePath=None, valueIndex=None, box=None):
+        """
+        saveBinary()で保存したHDF5ファイルを読み込む
+        格子データはchunk単位で圧縮されているので、必要な部分だけを読み込むことができる
+
+        valueIndex: 読み込む値のindex (int or intのlist) (Noneの場合は全て)
+        box: 読み込む格子点の範囲 [[i1start, i1stop], [i2start, i2stop], [i3start, i3stop]] (Noneの場合は全て)
+        """
+        import h5py
+
+        if binaryFilePath is None:
+            raise ValueError('binaryFilePath is None')
+
+        with h5py.File(binaryFilePath, mode='r') as f:
+            dataset = f['cubeData']
+            startingPoint = np.array(f.attrs['startingPoint'], dtype=np.float64)
+            stepVector = np.array(f.attrs['stepVector'], dtype=np.float64)
+            numGridPoint = np.array(f.attrs['numGridPoint'], dtype=np.int64)
+            valueNames = json.loads(f.attrs['valueNames'])
+            unit = str(f.attrs['unit'])
+
+            # 読み込む範囲
+            if box is None:
+                box = [[0, n] for n in numGridPoint]
+            box = np.array(box, dtype=np.int64)
+            if box.shape != (3,2) or np.any(box[:,0] < 0) or np.any(box[:,1] > numGridPoint) or np.any(box[:,0] >= box[:,1]):
+                raise ValueError('box must be [[start, stop], [start, stop], [start, stop]] within numGridPoint')
+            if valueIndex is None:
+                valueIndex = list(range(len(valueNames)))
+            elif type(valueIndex) is int:
+                valueIndex = [valueIndex]
+            if any([type(i) is not int or i < 0 or i >= len(valueNames) for i in valueIndex]):
+                raise ValueError('valueIndex is out of range')
+
+            # 指定された範囲だけ読み込む
+            boxSlice = tuple(slice(start, stop) for start, stop in box)
+            if valueIndex == list(range(len(valueNames))):
+                cubeData = dataset[boxSlice]
+            else:
+                cubeData = np.stack([dataset[boxSlice + (i,)] for i in valueIndex], axis=-1)
+            cubeData = cubeData.astype(np.float64)
+
+            if 'atomicNumData' in f.keys():
+                atomicNumData = np.array(f['atomicNumData'], dtype=np.int64)
+                atomXYZData = np.array(f['atomXYZData'], dtype=np.float64)
+            else:
+                atomicNumData = None
+                atomXYZData = None
+
+        self.__init__fromCubeData(
+            startingPoint=startingPoint + box[:,0] @ stepVector,
+            stepVector=stepVector,
+            numGridPoint=box[:,1] - box[:,0],
+            cubeData=cubeData,
+            valueDim=len(valueIndex),
+            valueNames=[valueNames[i] for i in valueIndex],
+            atomicNumData=atomicNumData,
+            atomXYZData=atomXYZData,
+            unit=unit
+        )
+
     def __checkValueNames(self, newValueNames, newValueDim):
         """
         追加するvalueNamesが適切な値になっているかをチェックし、可能ならば修正したもの(intかstrのlist)を返す
@@ -262,9 +395,22 @@ class Cube:
     def giveCubeData(self):
         """
         cubeデータと値の名前リストのコピーを返す
+        (memmapで読み込んだcubeの場合もメモリ上のコピーになるので注意)
         """
         return copy.deepcopy(self.__valueNames), copy.deepcopy(self.__cubeData)
 
+    def giveValueNames(self):
+        """
+        値の名前のリストを返す (長さはvalueDim)
+        """
+        return copy.deepcopy(self.__valueNames)
+
+    def giveUnit(self):
+        """
+        座標の単位('Bohr' or 'Angstrom')を返す
+        """
+        return self.__unit
+
     def giveStepVector(self):
         """
         cubeデータの実座標復元のための格子ベクトルを返す
@@ -286,6 +432,7 @@ class Cube:
     def giveNodeCoord(self):
         """
         格子座標を返す
+        格子全体の座標の配列を生成するので、大きなcubeではiterNodeCoord, giveNodeCoordComponent, giveNodeCoordRangeを使うこと
         return: np.ndarray (shape: (na, nb, nc, 3))
         """
         na, nb, nc = self.__numGridPoint
@@ -296,6 +443,62 @@ class Cube:
         nodeCoord = self.__startingPoint + a[:,:,:,np.newaxis] * sv1 + b[:,:,:,np.newaxis] * sv2 + c[:,:,:,np.newaxis] * sv3
         return nodeCoord
 
+    def iterNodeCoord(self, blockSize=1):
+        """
+        格子座標をa方向にblockSize枚ずつ生成するイテレータ
+        return: (start, stop, np.ndarray (shape: (stop-start, nb, nc, 3)))のイテレータ
+                (格子座標[start:stop]に相当)
+        """
+        if type(blockSize) is not int or blockSize < 1:
+            raise ValueError('blockSize must be a positive int')
+        na = self.__numGridPoint[0]
+        for start in range(0, na, blockSize):
+            stop = min(start+blockSize, na)
+            yield start, stop, self.__giveNodeCoordBlock(start, stop)
+
+    def __giveNodeCoordBlock(self, start, stop):
+        """
+        格子座標[start:stop]を返す
+        return: np.ndarray (shape: (stop-start, nb, nc, 3))
+        """
+        return _giveNodeCoordBlock(self.__startingPoint, self.__stepVector, self.__numGridPoint, start, stop)
+
+    def giveNodeCoordComponent(self, k):
+        """
+        格子座標のk成分(0: x, 1: y, 2: z)だけを返す
+        return: np.ndarray (shape: (na, nb, nc))
+        """
+        if k not in [0, 1, 2]:
+            raise ValueError('k must be 0, 1 or 2')
+        na, nb, nc = self.__numGridPoint
+        sv1, sv2, sv3 = self.__stepVector
+        return self.__startingPoint[k] + \
+                np.arange(na)[:,np.newaxis,np.newaxis] * sv1[k] + \
+                np.arange(nb)[np.newaxis,:,np.newaxis] * sv2[k] + \
+                np.arange(nc)[np.newaxis,np.newaxis,:] * sv3[k]
+
+    def giveNodeCoordRange(self):
+        """
+        格子座標の範囲(格子の8つの頂点から計算)を返す
+        return: np.ndarray (shape: (3,2)) : [[xmin,xmax],[ymin,ymax],[zmin,zmax]]
+        """
+        corner = np.array(list(itertools.product([0,1], repeat=3))) * (self.__numGridPoint - 1) # shape: (8, 3)
+        cornerCoord = self.__startingPoint + corner @ self.__stepVector # shape: (8, 3)
+        return np.stack([np.min(cornerCoord, axis=0), np.max(cornerCoord, axis=0)], axis=1)
+
+    def giveGridPlane(self, axis, index):
+        """
+        axis方向のindex番目の格子面上の値を返す (コピーせずにcubeDataのviewを返す)
+        return: np.ndarray (shape: (ni, nj, valueDim), i,jはaxis以外の2方向)
+        """
+        if axis not in [0, 1, 2]:
+            raise ValueError('axis must be 0, 1, or 2')
+        if type(index) is not int or index < 0 or index >= self.__numGridPoint[axis]:
+            raise ValueError('index is out of range')
+        key = [slice(None)] * 3
+        key[axis] = index
+        return self.__cubeData[tuple(key)]
+
     def giveAtomData(self):
         """
         各原子の原子番号と核座標を返す
@@ -320,9 +523,12 @@ class Cube:
         else:
             _r = r
 
-        V = self.__stepVector.T
-        Vinv = np.linalg.inv(V)
-        p = (Vinv @ (_r - self.__startingPoint).T).T # shape: (n, 3)
+        # 逆行列は一度だけ計算する
+        if self.__stepVectorInv is None:
+            V = self.__stepVector.T
+            self.__stepVectorInv = np.linalg.inv(V)
+        Vinv = self.__stepVectorInv
+        p = (_r - self.__startingPoint) @ Vinv.T # shape: (n, 3)
 
         if r.shape == (3,):
             return p.reshape(3)
@@ -336,27 +542,231 @@ class Cube:
         https://zenn.dev/tab_ki/articles/interpolation_of_3d_data
 
         r: 補間する位置ベクトル: np.ndarray (shape: (n, 3))
+        method: 'linear'(='trilinear'), 'tricubic', またはRegularGridInterpolatorの手法('nearest', 'cubic', ...)
         return: 補間値: np.ndarray (shape: (n, valueDim))
+                cubeの範囲外の点はnp.nan
         """
+        r = np.asarray(r, dtype=np.float64)
 
-        # RegularGridInterpolatorを使って補間計算を行う
-        # ただし、補間関数を生成するときに、グリッド位置を
-        # [0,1,...,na], [0,1,...,nb], [0,1,...,nc]の3配列で指定する仕様であるため、
         # 実格子座標(r)を直交系座標(p)へ変換する(__convertCoordToOrtho)
+        p = self.__convertCoordToOrtho(r)
 
-        # 補間関数の生成
-        na, nb, nc = self.__numGridPoint
-        # bounds_error: Falseの場合、補外することになった場合適当な値を代わりにセットする(デフォルト: np.nan)
-        interp = RegularGridInterpolator((np.arange(na), np.arange(nb), np.arange(nc)), self.__cubeData, bounds_error=False)
+        # trilinear, tricubicは直交系座標の上で直接計算する
+        if method in ['linear', 'trilinear']:
+            return self.__interpolateConvolution(p, 'trilinear')
+        elif method == 'tricubic':
+            return self.__interpolateConvolution(p, 'tricubic')
 
-        # 指定された座標を直交系に変換
-        p = self.__convertCoordToOrtho(r)
+        # それ以外はRegularGridInterpolatorを使って補間計算を行う
+        # ただし、補間関数を生成するときに、グリッド位置を
+        # [0,1,...,na], [0,1,...,nb], [0,1,...,nc]の3配列で指定する仕様であるため、直交系座標を使う
+        # 補間関数は手法毎に一度だけ生成する
+        if method not in self.__interpolatorDict.keys():
+            na, nb, nc = self.__numGridPoint
+            # bounds_error: Falseの場合、補外することになった場合適当な値を代わりにセットする(デフォルト: np.nan)
+            self.__interpolatorDict[method] = RegularGridInterpolator((np.arange(na), np.arange(nb), np.arange(nc)), self.__cubeData, method=method, bounds_error=False)
+        interp = self.__interpolatorDict[method]
 
-        # 補間手法を設定
-        interp.method = method
         # 補間値を計算
         return interp(p)
 
+    def __interpolateConvolution(self, p, method, chunkSize=65536):
+        """
+        直交系座標pでの補間値を、周囲の格子点の値の重み付き和として計算する
+        trilinear: 周囲2x2x2点、tricubic: 周囲4x4x4点(Catmull-Rom型の3次畳み込み、端では端の値を繰り返す)
+
+        p: np.ndarray (shape: (n, 3) or (3,))
+        return: np.ndarray (shape: (n, valueDim) or (valueDim,))
+        """
+        _p = p.reshape(-1,3)
+        numGridPoint = self.__numGridPoint
+        result = np.full((len(_p), self.__valueDim), np.nan)
+
+        # cubeの範囲内の点だけ計算する
+        isInside = np.all((_p >= 0) & (_p <= numGridPoint-1), axis=1)
+        insideIndex = np.where(isInside)[0]
+
+        for start in range(0, len(insideIndex), chunkSize):
+            index = insideIndex[start:start+chunkSize]
+            pi = _p[index]
+            # 基準の格子点と、そこからの位置(0<=t<=1)
+            base = np.clip(np.floor(pi).astype(np.int64), 0, np.maximum(numGridPoint-2, 0))
+            t = pi - base # shape: (m, 3)
+
+            if method == 'trilinear':
+                offsets = np.array([0, 1])
+                weights = np.stack([1-t, t], axis=2) # shape: (m, 3, 2)
+            else:
+                offsets = np.array([-1, 0, 1, 2])
+                t2 = t**2
+                t3 = t**3
+                weights = np.stack([
+                    (-t3 + 2*t2 - t) / 2,
+                    (3*t3 - 5*t2 + 2) / 2,
+                    (-3*t3 + 4*t2 + t) / 2,
+                    (t3 - t2) / 2
+                ], axis=2) # shape: (m, 3, 4)
+
+            # 各軸の参照する格子点 (範囲外は端の点にする)
+            gridIndex = np.clip(base[:,:,np.newaxis] + offsets, 0, (numGridPoint-1)[:,np.newaxis]) # shape: (m, 3, numOffset)
+            values = self.__cubeData[
+                gridIndex[:,0,:,np.newaxis,np.newaxis],
+                gridIndex[:,1,np.newaxis,:,np.newaxis],
+                gridIndex[:,2,np.newaxis,np.newaxis,:]
+            ] # shape: (m, numOffset, numOffset, numOffset, valueDim)
+            result[index] = np.einsum('mi,mj,mk,mijkv->mv', weights[:,0], weights[:,1], weights[:,2], values)
+
+        if p.shape == (3,):
+            return result[0]
+        else:
+            return result
+
+
+    def __reduceBlocks(self, blockFunc, blockSize, numThread):
+        """
+        格子をa方向にblockSize枚ずつに分け、各ブロックにblockFuncを適用した結果のリストを返す
+        (memmapのcubeでも1ブロック分ずつしかメモリに載らない)
+
+        blockFunc: (格子座標(shape: (k, nb, nc, 3)), 値(shape: (k, nb, nc, valueDim)), start) -> 任意の部分結果
+        numThread: 並列に計算するスレッド数
+        """
+        if type(blockSize) is not int or blockSize < 1:
+            raise ValueError('blockSize must be a positive int')
+        if type(numThread) is not int or numThread < 1:
+            raise ValueError('numThread must be a positive int')
+
+        na = self.__numGridPoint[0]
+        blockList = [(start, min(start+blockSize, na)) for start in range(0, na, blockSize)]
+
+        def calcBlock(block):
+            start, stop = block
+            return blockFunc(self.__giveNodeCoordBlock(start, stop), np.asarray(self.__cubeData[start:stop]), start)
+
+        if numThread == 1:
+            return [calcBlock(block) for block in blockList]
+        with ThreadPoolExecutor(max_workers=numThread) as executor:
+            return list(executor.map(calcBlock, blockList))
+
+    def __checkValueIndex(self, valueIndex):
+        """
+        valueIndexをintのリストに変換する (Noneの場合は全て)
+        """
+        if valueIndex is None:
+            return list(range(self.__valueDim))
+        if type(valueIndex) is int:
+            valueIndex = [valueIndex]
+        if any([type(i) is not int or i < 0 or i >= self.__valueDim for i in valueIndex]):
+            raise ValueError('valueIndex is out of range')
+        return list(valueIndex)
+
+    def giveCellVolume(self):
+        """
+        格子1つ分の体積 |det(stepVector)| を返す
+        """
+        return abs(np.linalg.det(self.__stepVector))
+
+    def integrate(self, valueIndex=None, mask=None, blockSize=8, numThread=1):
+        """
+        値の積分 sum(value) * (格子1つ分の体積) を計算
+
+        valueIndex: 積分する値のindex (int or intのlist) (Noneの場合は全て)
+        mask: 積分する領域を決める関数 (Noneの場合は全体)
+              mask(格子座標(shape: (k, nb, nc, 3)), 値(shape: (k, nb, nc, valueDim))) -> bool (shape: (k, nb, nc))
+              例: 等値面の内側 mask=lambda r, v: v[:,:,:,0] > 0.05
+        blockSize: 一度に計算するa方向の格子の枚数
+        numThread: 並列に計算するスレッド数
+        return: np.ndarray (shape: (len(valueIndex),))
+        """
+        valueIndex = self.__checkValueIndex(valueIndex)
+
+        def blockFunc(coord, value, start):
+            if mask is None:
+                return np.sum(value[:,:,:,valueIndex], axis=(0,1,2))
+            isInside = mask(coord, value)
+            return np.sum(value[:,:,:,valueIndex][isInside], axis=0)
+
+        partialSums = self.__reduceBlocks(blockFunc, blockSize, numThread)
+        return np.sum(partialSums, axis=0) * self.giveCellVolume()
+
+    def integrateSphere(self, center, radius, valueIndex=None, blockSize=8, numThread=1):
+        """
+        中心center, 半径radiusの球の内側で値を積分
+        center: np.ndarray or list (shape: (3,)) または原子のindex(int)
+        return: np.ndarray (shape: (len(valueIndex),))
+        """
+        if isinstance(center, (int, np.integer)):
+            if self.__atomXYZData is None:
+                raise ValueError('cube does not contain atom data')
+            center = self.__atomXYZData[center]
+        center = np.asarray(center, dtype=np.float64)
+        if center.shape != (3,):
+            raise ValueError('shape of center must be (3,)')
+
+        mask = lambda coord, value: np.sum((coord - center)**2, axis=3) <= radius**2
+        return self.integrate(valueIndex=valueIndex, mask=mask, blockSize=blockSize, numThread=numThread)
+
+    def calcMoment(self, valueIndex=None, origin=None, blockSize=8, numThread=1):
+        """
+        値の1次のモーメント sum(value * (r - origin)) * (格子1つ分の体積) を計算
+        origin: 原点 (Noneの場合は[0,0,0])
+        return: np.ndarray (shape: (len(valueIndex), 3))
+        """
+        valueIndex = self.__checkValueIndex(valueIndex)
+        if origin is None:
+            origin = np.zeros(3)
+        origin = np.asarray(origin, dtype=np.float64)
+
+        def blockFunc(coord, value, start):
+            return np.einsum('ijkv,ijkx->vx', value[:,:,:,valueIndex], coord - origin)
+
+        partialSums = self.__reduceBlocks(blockFunc, blockSize, numThread)
+        return np.sum(partialSums, axis=0) * self.giveCellVolume()
+
+    def calcDipoleMoment(self, valueIndex=0, origin=None, includeNuclei=True, blockSize=8, numThread=1):
+        """
+        値を電子密度とみなして双極子モーメントを計算 (単位: 座標の単位 * 電荷)
+        mu = - sum(rho * (r - origin)) dV + sum(Z * (R - origin))
+        includeNuclei: 原子核(電荷は原子番号)の寄与を含めるか
+        return: np.ndarray (shape: (3,))
+        """
+        if origin is None:
+            origin = np.zeros(3)
+        origin = np.asarray(origin, dtype=np.float64)
+
+        dipole = - self.calcMoment(valueIndex=valueIndex, origin=origin, blockSize=blockSize, numThread=numThread)[0]
+        if includeNuclei:
+            if self.__atomicNumData is None:
+                raise ValueError('cube does not contain atom data')
+            dipole += self.__atomicNumData @ (self.__atomXYZData - origin)
+        return dipole
+
+    def giveMinMax(self, valueIndex=None, blockSize=8, numThread=1):
+        """
+        値の最小値と最大値、およびその位置を返す (nanは無視する)
+        return: (最小値(shape: (len(valueIndex),)), 最小値の座標(shape: (len(valueIndex), 3)),
+                 最大値(shape: (len(valueIndex),)), 最大値の座標(shape: (len(valueIndex), 3)))
+        """
+        valueIndex = self.__checkValueIndex(valueIndex)
+
+        def blockFunc(coord, value, start):
+            value = value[:,:,:,valueIndex].reshape(-1, len(valueIndex))
+            coord = coord.reshape(-1, 3)
+            result = []
+            for arg in [np.nanargmin, np.nanargmax]:
+                index = np.array([arg(value[:,v]) if not np.all(np.isnan(value[:,v])) else 0 for v in range(len(valueIndex))])
+                result.append((value[index, np.arange(len(valueIndex))], coord[index]))
+            return result
+
+        partialResults = self.__reduceBlocks(blockFunc, blockSize, numThread)
+        minValues = np.array([r[0][0] for r in partialResults]) # shape: (numBlock, len(valueIndex))
+        minCoords = np.array([r[0][1] for r in partialResults]) # shape: (numBlock, len(valueIndex), 3)
+        maxValues = np.array([r[1][0] for r in partialResults])
+        maxCoords = np.array([r[1][1] for r in partialResults])
+
+        minBlock = np.argmin(np.where(np.isnan(minValues), np.inf, minValues), axis=0)
+        maxBlock = np.argmax(np.where(np.isnan(maxValues), -np.inf, maxValues), axis=0)
+        vi = np.arange(len(valueIndex))
+        return minValues[minBlock, vi], minCoords[minBlock, vi], maxValues[maxBlock, vi], maxCoords[maxBlock, vi]
 
     def addCubeData(self, newCubeData, newValueNames=None):
         """
@@ -377,11 +787,339 @@ class Cube:
         # 値の名前設定
         # チェック
         newValueNames = self.__checkValueNames(newValueNames, newValueDim)
+
+        # 問題なければcubeDataに追加
+        # 値の数方向に余裕を持たせたバッファを確保しておき、足りなくなったら2倍に広げる
+        # (追加の度に全体をコピーしないようにする)
+        valueDim = self.__valueDim
+        if self.__cubeBuffer is None or self.__cubeBuffer.shape[3] < valueDim + newValueDim:
+            capacity = max(valueDim + newValueDim, 2 * valueDim)
+            buffer = np.empty((*self.__cubeData.shape[:3], capacity))
+            buffer[:,:,:,:valueDim] = self.__cubeData
+            self.__cubeBuffer = buffer
+        self.__cubeBuffer[:,:,:,valueDim:valueDim+newValueDim] = newCubeData
+        self.__cubeData = self.__cubeBuffer[:,:,:,:valueDim+newValueDim]
+
         self.__valueDim += newValueDim
         self.__valueNames.extend(newValueNames)
+        self.__resetCache()
 
-        # 問題なければcubeDataに追加
-        self.__cubeData = np.block([self.__cubeData, newCubeData])
+    def isSameGrid(self, other):
+        """
+        otherと格子(startingPoint, stepVector, numGridPoint)が一致するか
+        """
+        return np.array_equal(self.__numGridPoint, other.__numGridPoint) and \
+                np.allclose(self.__startingPoint, other.__startingPoint) and \
+                np.allclose(self.__stepVector, other.__stepVector)
+
+    def concatenate(self, others):
+        """
+        格子が一致するCubeの値を、値の次元方向に連結した新しいCubeを返す
+        (原子データはselfのものを使う)
+        others: Cube または list of Cube
+        return: Cube (valueDim: 全てのCubeのvalueDimの和)
+        """
+        if isinstance(others, Cube):
+            others = [others]
+        for other in others:
+            if not isinstance(other, Cube):
+                raise TypeError('others must be Cube or list of Cube')
+            if not self.isSameGrid(other):
+                raise ValueError('grids of cubes do not match (startingPoint, stepVector, numGridPoint)')
+
+        cubeList = [self, *others]
+        cubeData = np.concatenate([np.asarray(c.__cubeData) for c in cubeList], axis=3)
+        valueNames = [name for c in cubeList for name in c.__valueNames]
+        return self.__newCubeLike(cubeData, valueNames)
+
+    def __giveOperand(self, other):
+        """
+        演算の相手をcubeDataとbroadcastできる配列に変換する
+        other: Cube (格子が一致し、valueDimが1か等しいもの), スカラー, np.ndarray
+        """
+        if isinstance(other, Cube):
+            if not self.isSameGrid(other):
+                raise ValueError('grids of cubes do not match (startingPoint, stepVector, numGridPoint)')
+            if other.__valueDim not in [1, self.__valueDim] and self.__valueDim != 1:
+                raise ValueError('valueDim of cubes do not match')
+            return other.__cubeData
+        return other
+
+    def __newCubeLike(self, cubeData, valueNames=None, startingPoint=None, stepVector=None, numGridPoint=None):
+        """
+        格子と原子データが同じで、cubeDataが異なるCubeを生成する
+        (cubeDataはコピーしない)
+        startingPoint, stepVector, numGridPoint: 指定した場合は格子をこれに置き換える
+        """
+        valueDim = cubeData.shape[3]
+        if valueNames is None or len(valueNames) != valueDim:
+            valueNames = None
+        return Cube(
+            startingPoint=np.array(startingPoint if startingPoint is not None else self.__startingPoint, dtype=np.float64),
+            stepVector=np.array(stepVector if stepVector is not None else self.__stepVector, dtype=np.float64),
+            numGridPoint=np.array(numGridPoint if numGridPoint is not None else self.__numGridPoint, dtype=np.int64),
+            cubeData=np.asarray(cubeData, dtype=np.float64),
+            valueDim=valueDim,
+            valueNames=list(valueNames) if valueNames is not None else None,
+            atomicNumData=self.__atomicNumData.copy() if self.__atomicNumData is not None else None,
+            atomXYZData=self.__atomXYZData.copy() if self.__atomXYZData is not None else None,
+            unit=self.__unit
+        )
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        numpyのufunc(np.add, np.sqrt, ...)をcubeDataに適用する
+        Cube同士の場合は格子が一致しているかを確認する
+        out=Cubeの場合はそのCubeのcubeDataに書き込む
+        """
+        if method != '__call__':
+            return NotImplemented
+
+        operands = []
+        for x in inputs:
+            if isinstance(x, Cube):
+                operands.append(self.__giveOperand(x))
+            else:
+                operands.append(x)
+
+        out = kwargs.pop('out', None)
+        if out is not None:
+            if len(out) != 1 or not isinstance(out[0], Cube):
+                return NotImplemented
+            outCube = out[0]
+            if outCube is not self and not self.isSameGrid(outCube):
+                raise ValueError('grids of cubes do not match (startingPoint, stepVector, numGridPoint)')
+            ufunc(*operands, out=outCube.__cubeData, **kwargs)
+            outCube.__resetCache()
+            return outCube
+
+        result = ufunc(*operands, **kwargs)
+        if type(result) is tuple or np.ndim(result) != 4 or result.shape[:3] != tuple(self.__numGridPoint):
+            return result
+        return self.__newCubeLike(result, self.__valueNames)
+
+    def __add__(self, other):
+        return np.add(self, other)
+
+    def __radd__(self, other):
+        return np.add(other, self)
+
+    def __sub__(self, other):
+        return np.subtract(self, other)
+
+    def __rsub__(self, other):
+        return np.subtract(other, self)
+
+    def __mul__(self, other):
+        return np.multiply(self, other)
+
+    def __rmul__(self, other):
+        return np.multiply(other, self)
+
+    def __truediv__(self, other):
+        return np.true_divide(self, other)
+
+    def __rtruediv__(self, other):
+        return np.true_divide(other, self)
+
+    def __neg__(self):
+        return np.negative(self)
+
+    def __iadd__(self, other):
+        return np.add(self, other, out=(self,))
+
+    def __isub__(self, other):
+        return np.subtract(self, other, out=(self,))
+
+    def __imul__(self, other):
+        return np.multiply(self, other, out=(self,))
+
+    def __itruediv__(self, other):
+        return np.true_divide(self, other, out=(self,))
+
+    def resample(self, targetGrid, method='linear', blockSize=8):
+        """
+        別の格子の上に値を補間し直したCubeを返す (斜交格子にも対応)
+        格子点はa方向にblockSize枚ずつ補間するので、大きな格子でも座標の配列は1ブロック分しか作らない
+
+        targetGrid: Cube, または (startingPoint, stepVector, numGridPoint)
+        method: 補間手法 (interpolateを参照)
+        return: Cube (格子の範囲外の点はnp.nan)
+        """
+        if isinstance(targetGrid, Cube):
+            startingPoint = targetGrid.__startingPoint.copy()
+            stepVector = targetGrid.__stepVector.copy()
+            numGridPoint = targetGrid.__numGridPoint.copy()
+            if targetGrid.__unit != self.__unit:
+                raise ValueError('units of cubes do not match')
+        elif type(targetGrid) in [list, tuple] and len(targetGrid) == 3:
+            startingPoint = np.array(targetGrid[0], dtype=np.float64)
+            stepVector = np.array(targetGrid[1], dtype=np.float64)
+            numGridPoint = np.array(targetGrid[2], dtype=np.int64)
+        else:
+            raise TypeError('targetGrid must be Cube or (startingPoint, stepVector, numGridPoint)')
+        if type(blockSize) is not int or blockSize < 1:
+            raise ValueError('blockSize must be a positive int')
+
+        cubeData = np.empty((*numGridPoint, self.__valueDim))
+        for start in range(0, numGridPoint[0], blockSize):
+            stop = min(start+blockSize, numGridPoint[0])
+            coord = _giveNodeCoordBlock(startingPoint, stepVector, numGridPoint, start, stop)
+            cubeData[start:stop] = self.interpolate(coord.reshape(-1,3), method=method).reshape(*coord.shape[:3], self.__valueDim)
+
+        return self.__newCubeLike(cubeData, self.__valueNames, startingPoint, stepVector, numGridPoint)
+
+    def coarsen(self, factor, blockSize=8):
+        """
+        factor^3個の格子点の値を平均して、粗い格子のCubeを返す
+        新しい格子点は平均した格子点の中心に置く (割り切れない端の格子点は捨てる)
+
+        factor: int または (f1, f2, f3)
+        blockSize: 一度に処理する新しい格子のa方向の枚数
+        return: Cube
+        """
+        factor = np.array([factor]*3 if type(factor) is int else factor, dtype=np.int64)
+        if factor.shape != (3,) or np.any(factor < 1):
+            raise ValueError('factor must be a positive int or (f1, f2, f3)')
+        numGridPoint = self.__numGridPoint // factor
+        if np.any(numGridPoint < 1):
+            raise ValueError('factor is larger than numGridPoint')
+        f1, f2, f3 = factor
+        n1, n2, n3 = numGridPoint
+
+        cubeData = np.empty((n1, n2, n3, self.__valueDim))
+        for start in range(0, n1, blockSize):
+            stop = min(start+blockSize, n1)
+            block = np.asarray(self.__cubeData[start*f1:stop*f1, :n2*f2, :n3*f3])
+            cubeData[start:stop] = block.reshape(stop-start, f1, n2, f2, n3, f3, self.__valueDim).mean(axis=(1,3,5))
+
+        return self.__newCubeLike(
+            cubeData, self.__valueNames,
+            startingPoint=self.__startingPoint + ((factor - 1) / 2) @ self.__stepVector,
+            stepVector=self.__stepVector * factor[:,np.newaxis],
+            numGridPoint=numGridPoint
+        )
+
+    def crop(self, box):
+        """
+        格子の一部を切り出したCubeを返す
+        box: 切り出す格子点の範囲 [[i1start, i1stop], [i2start, i2stop], [i3start, i3stop]]
+        return: Cube
+        """
+        box = np.array(box, dtype=np.int64)
+        if box.shape != (3,2) or np.any(box[:,0] < 0) or np.any(box[:,1] > self.__numGridPoint) or np.any(box[:,0] >= box[:,1]):
+            raise ValueError('box must be [[start, stop], [start, stop], [start, stop]] within numGridPoint')
+
+        cubeData = np.array(self.__cubeData[box[0,0]:box[0,1], box[1,0]:box[1,1], box[2,0]:box[2,1]])
+        return self.__newCubeLike(
+            cubeData, self.__valueNames,
+            startingPoint=self.__startingPoint + box[:,0] @ self.__stepVector,
+            numGridPoint=box[:,1] - box[:,0]
+        )
+
+    def giveIsosurface(self, isovalue, valueIndex=0, blockSize=16):
+        """
+        等値面を三角形メッシュとして抽出する (marching tetrahedra)
+        各格子セルを対角線を共有する6個の四面体に分割し、四面体の辺上で線形補間して頂点を求める
+        隣り合うセルで分割が一致するので、頂点を共有した隙間のないメッシュになる
+        格子点はa方向にblockSize枚ずつ処理するので、メモリ上に格子全体の四面体を作ることはない
+
+        isovalue: 等値面の値 (float, またはfloatのlist)
+        valueIndex: 対象とする値のインデックス
+        return: Isosurface (isovalueがlistの場合はlist of Isosurface)
+        """
+        if type(isovalue) in [list, tuple, np.ndarray]:
+            return [self.giveIsosurface(float(v), valueIndex=valueIndex, blockSize=blockSize) for v in isovalue]
+        if type(valueIndex) is not int:
+            raise TypeError('valueIndex must be int')
+        valueIndex = self.__checkValueIndex(valueIndex)[0]
+        if type(blockSize) is not int or blockSize < 1:
+            raise ValueError('blockSize must be a positive int')
+
+        na, nb, nc = self.__numGridPoint
+        # 格子点の値がisovalueに等しい場合は、isovalueよりわずかに小さい値として扱う
+        # (そのままでは頂点が格子点上に重なり、向きの揃わない面積0の三角形ができる)
+        # 全てのブロックで同じ値にするため、データ全体の大きさから決める
+        valueScale = np.nanmax(np.abs(self.__cubeData[:, :, :, valueIndex]), initial=0.0)
+        tieShift = 1e-6 * (max(valueScale, abs(isovalue)) or 1.0)
+        keyList = []
+        vertexList = []
+        directionList = []
+        for start in range(0, na-1, blockSize):
+            stop = min(start+blockSize, na-1)
+            # セル[start:stop]の頂点となる格子点の値
+            value = np.asarray(self.__cubeData[start:stop+1, :, :, valueIndex], dtype=np.float64)
+            value = np.where(value == isovalue, isovalue - tieShift, value)
+            inside = value > isovalue
+            # 等値面と交差するセル(頂点の内外が混在する、NaNを含まない)のみを対象にする
+            corners = [inside[i:i+value.shape[0]-1, j:j+nb-1, k:k+nc-1] for i, j, k in _cellCorners]
+            cellValid = np.all([np.isfinite(value[i:i+value.shape[0]-1, j:j+nb-1, k:k+nc-1]) for i, j, k in _cellCorners], axis=0)
+            cellMixed = np.any(corners, axis=0) & ~np.all(corners, axis=0) & cellValid
+            cellIndex = np.argwhere(cellMixed)
+            if len(cellIndex) == 0:
+                continue
+
+            # 四面体の頂点の格子インデックス (shape: (numCell, 6, 4, 3))
+            tetIndex = cellIndex[:,np.newaxis,np.newaxis,:] + _tetCorners
+            tetValue = value[tetIndex[...,0], tetIndex[...,1], tetIndex[...,2]].reshape(-1, 4)
+            tetIndex = tetIndex.reshape(-1, 4, 3)
+            tetIndex[:,:,0] += start
+            tetNode = (tetIndex[:,:,0] * nb + tetIndex[:,:,1]) * nc + tetIndex[:,:,2]
+            tetInside = tetValue > isovalue
+            case = tetInside @ np.array([1,2,4,8])
+
+            for triEdge in _tetTriangleTable.transpose(1,0,2):
+                # triEdge: 各ケースでの三角形の3辺 (三角形がない場合は-1)
+                edge = triEdge[case]
+                target = edge[:,0] >= 0
+                if not np.any(target):
+                    continue
+                edge = edge[target]
+                tIndex = np.nonzero(target)[0]
+                # 辺の両端 (格子点の通し番号の小さい方をp0とし、同じ辺からは常に同じ頂点が得られるようにする)
+                p0 = _tetEdges[edge,0]
+                p1 = _tetEdges[edge,1]
+                n0 = tetNode[tIndex[:,np.newaxis], p0]
+                n1 = tetNode[tIndex[:,np.newaxis], p1]
+                swap = n0 > n1
+                p0, p1 = np.where(swap, p1, p0), np.where(swap, p0, p1)
+                n0, n1 = np.minimum(n0, n1), np.maximum(n0, n1)
+                v0 = tetValue[tIndex[:,np.newaxis], p0]
+                v1 = tetValue[tIndex[:,np.newaxis], p1]
+                t = (isovalue - v0) / (v1 - v0)
+                i0 = tetIndex[tIndex[:,np.newaxis], p0]
+                i1 = tetIndex[tIndex[:,np.newaxis], p1]
+                vertexList.append((i0 + t[...,np.newaxis] * (i1 - i0)).reshape(-1, 3))
+                keyList.append((n0 * (na*nb*nc) + n1).reshape(-1))
+                # 三角形の向きを決めるため、四面体の内側の頂点から外側の頂点へ向かうベクトルを記録する
+                tInside = tetInside[tIndex]
+                insideCenter = np.sum(tetIndex[tIndex] * tInside[...,np.newaxis], axis=1) / np.sum(tInside, axis=1)[:,np.newaxis]
+                outsideCenter = np.sum(tetIndex[tIndex] * ~tInside[...,np.newaxis], axis=1) / np.sum(~tInside, axis=1)[:,np.newaxis]
+                directionList.append(outsideCenter - insideCenter)
+
+        if len(keyList) == 0:
+            return Isosurface(np.zeros((0,3)), np.zeros((0,3), dtype=np.int64), isovalue=isovalue, unit=self.__unit)
+
+        # 同じ辺上の頂点を1つにまとめる
+        key = np.concatenate(keyList)
+        vertexIndex = np.concatenate(vertexList)
+        _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+        vertices = self.__startingPoint + vertexIndex[first] @ self.__stepVector
+        faces = inverse.reshape(-1, 3)
+        direction = np.concatenate(directionList) @ self.__stepVector
+
+        # 退化した三角形(格子点上に頂点がある場合に生じる)を除く
+        nonDegenerate = (faces[:,0] != faces[:,1]) & (faces[:,1] != faces[:,2]) & (faces[:,2] != faces[:,0])
+        faces = faces[nonDegenerate]
+        direction = direction[nonDegenerate]
+
+        # 法線が値の大きい側から小さい側を向くように揃える
+        v0, v1, v2 = vertices[faces[:,0]], vertices[faces[:,1]], vertices[faces[:,2]]
+        normal = np.cross(v1 - v0, v2 - v0)
+        flip = np.sum(normal * direction, axis=1) < 0
+        faces[flip] = faces[flip][:,[0,2,1]]
+
+        return Isosurface(vertices, faces, isovalue=isovalue, unit=self.__unit)
 
     def write(self, cubeFilePath, header=True):
         """
@@ -412,10 +1150,10 @@ class Cube:
         if header:
             header1 = 'Cube Data generated by Gaussian-Utility LoadCUBE.Cube.write()\n'
             header2 = 'value:{}\n'.format(self.__valueNames)
-            header3 = '{} {} {} {} {}\n'.format(self.__numAtom, *self.__startingPoint, self.__valueDim)
-            header456 = ''.join(['{} {} {} {}\n'.format(n,*v) for n,v in zip(self.__numGridPoint,self.__stepVector)])
+            header3 = '{:5d}{:12.6f}{:12.6f}{:12.6f}{:5d}\n'.format(self.__numAtom, *self.__startingPoint, self.__valueDim)
+            header456 = ''.join(['{:5d}{:12.6f}{:12.6f}{:12.6f}\n'.format(n,*v) for n,v in zip(self.__numGridPoint,self.__stepVector)])
             if self.__atomicNumData is not None:
-                header7 = ''.join(['{} {} {} {} {}\n'.format(n,n,*v) for n,v in zip(self.__atomicNumData,self.__atomXYZData)])
+                header7 = ''.join(['{:5d}{:12.6f}{:12.6f}{:12.6f}{:12.6f}\n'.format(n,n,*v) for n,v in zip(self.__atomicNumData,self.__atomXYZData)])
             else:
                 header7 = ''
 
@@ -423,25 +1161,69 @@ class Cube:
         else:
             headerContents = ''
 
-        # format用のテンプレートを予め最後まで作っておいて、一気にcubeDataを流し込む感じで作る
-        # (0,0,n3,d)までの間に6個値を出力する行の数と、端数の行の数(0 or 1)を取得し、(0,0,n3,d)までのテンプレートをまず作成
-        numValueTon3d = self.__cubeData.shape[2] * self.__cubeData.shape[3]
+        # (i,j,*,*)の1行分(n3*valueDim個の値)のテンプレートを作り、
+        # x方向の1枚(n2行分)ずつ値を流し込んで書き出す
+        # 値はcubegenと同じ固定幅(%13.5E)で1行に6個ずつ出力する
+        n1, n2, n3, valueDim = self.__cubeData.shape
+        numValueTon3d = n3 * valueDim
         numLineSixValue = numValueTon3d // 6
         numFraction = numValueTon3d % 6 # 端数行に含まれる値の数
-        numLineFraction = np.sign(numFraction) # 端数行の数(0 or 1)
-        sixValueLineTemplate = ''.join(['{} ' for _ in range(6)]) + '\n'
-        fractionLineTemplate = ''.join(['{} ' for _ in range(numFraction)]) + '\n'
-        formatTemplate = ''.join([sixValueLineTemplate for _ in range(numLineSixValue)] + [fractionLineTemplate for _ in range(numLineFraction)])
-        formatTemplate = ''.join(itertools.repeat(formatTemplate, self.__cubeData.shape[0] * self.__cubeData.shape[1]))
-
-        mainContents = formatTemplate.format(*self.__cubeData.reshape(-1))
+        valueTemplate = ' %12.5E'
+        rowTemplate = (valueTemplate * 6 + '\n') * numLineSixValue
+        if numFraction > 0:
+            rowTemplate += valueTemplate * numFraction + '\n'
+        slabTemplate = rowTemplate * n2
 
         # 書き出し
         with open(cubeFilePath, mode='w') as f:
             f.write(headerContents)
-            f.write(mainContents)
+            for i in range(n1):
+                f.write(slabTemplate % tuple(self.__cubeData[i].reshape(-1).tolist()))
 
 
+    def saveBinary(self, filePath, dtype='float64', compression='gzip', compressionLevel=4, chunkShape=None):
+        """
+        CubeデータをHDF5ファイルに保存 (h5pyが必要)
+        格子データはchunk毎に圧縮して保存するので、Cube(binaryFilePath=..., valueIndex=..., box=...)で一部だけを読み込める
+
+        filePath: 書き出し先
+        dtype: 格子データの型 ('float64' or 'float32')
+        compression: 圧縮方式 ('gzip', 'lzf', None)
+        compressionLevel: gzipの圧縮レベル (0-9)
+        chunkShape: chunkの形 (n1, n2, n3) (Noneの場合は各方向32点まで)
+        """
+        import h5py
+
+        if dtype not in ['float64', 'float32']:
+            raise ValueError('dtype must be float64 or float32')
+        if chunkShape is None:
+            chunkShape = [min(n, 32) for n in self.__numGridPoint]
+        if len(chunkShape) != 3:
+            raise ValueError('length of chunkShape must be 3')
+
+        with h5py.File(filePath, mode='w') as f:
+            # 値毎に読み込めるように、valueDim方向のchunkの大きさは1にする
+            dataset = f.create_dataset(
+                'cubeData',
+                shape=self.__cubeData.shape,
+                dtype=dtype,
+                chunks=(*[int(n) for n in chunkShape], 1),
+                compression=compression,
+                compression_opts=compressionLevel if compression == 'gzip' else None
+            )
+            # メモリに載らない場合も考えて、x方向の1枚ずつ書き込む
+            for i in range(self.__cubeData.shape[0]):
+                dataset[i] = self.__cubeData[i]
+
+            f.attrs['startingPoint'] = self.__startingPoint
+            f.attrs['stepVector'] = self.__stepVector
+            f.attrs['numGridPoint'] = self.__numGridPoint
+            f.attrs['valueNames'] = json.dumps(self.__valueNames)
+            f.attrs['unit'] = self.__unit
+            if self.__atomicNumData is not None:
+                f.create_dataset('atomicNumData', data=self.__atomicNumData)
+                f.create_dataset('atomXYZData', data=self.__atomXYZData)
+
     def debug(self):
         print('startingPoint')
         print(self.__startingPoint)
@@ -491,22 +1273,196 @@ class Cube:
         # 変換
         self.__startingPoint *= factor
         self.__stepVector *= factor
-        self.__atomXYZData *= factor
+        if self.__atomXYZData is not None:
+            self.__atomXYZData *= factor
+        self.__unit = unit
+        self.__resetCache()
+
+
+def _giveTetTriangleTable():
+    """
+    marching tetrahedra の三角形テーブルを作る
+    四面体の頂点iが等値面の内側(値がisovalueより大きい)なら bit i を立てたものをケース番号とし、
+    各ケースについて最大2個の三角形を、_tetEdgesのインデックス3個の組で返す (三角形がない場合は-1)
+    return: np.ndarray (shape: (16, 2, 3))
+    """
+    edgeDict = {tuple(e): i for i, e in enumerate(_tetEdges.tolist())}
+    edge = lambda p, q: edgeDict[(min(p,q), max(p,q))]
+
+    table = -np.ones((16, 2, 3), dtype=np.int64)
+    for case in range(1, 15):
+        inside = [p for p in range(4) if case >> p & 1]
+        outside = [p for p in range(4) if not case >> p & 1]
+        if len(inside) == 1 or len(outside) == 1:
+            # 1頂点だけが反対側にある場合は三角形1個
+            single, others = (inside[0], outside) if len(inside) == 1 else (outside[0], inside)
+            table[case,0] = [edge(single, q) for q in others]
+        else:
+            # 2頂点ずつに分かれる場合は四角形(a-c, a-d, b-d, b-c)を三角形2個に分ける
+            (a, b), (c, d) = inside, outside
+            table[case,0] = [edge(a,c), edge(a,d), edge(b,d)]
+            table[case,1] = [edge(a,c), edge(b,d), edge(b,c)]
+    return table
+
+# 格子セルの8頂点のオフセット
+_cellCorners = list(itertools.product([0,1], repeat=3))
+# 格子セルを主対角線(0,0,0)-(1,1,1)を共有する6個の四面体に分割したときの各頂点のオフセット (shape: (6, 4, 3))
+_tetCorners = np.array([
+    [[0,0,0], np.eye(3, dtype=np.int64)[p[0]], np.eye(3, dtype=np.int64)[p[0]] + np.eye(3, dtype=np.int64)[p[1]], [1,1,1]]
+    for p in itertools.permutations(range(3))
+], dtype=np.int64)
+# 四面体の6辺
+_tetEdges = np.array(list(itertools.combinations(range(4), 2)), dtype=np.int64)
+_tetTriangleTable = _giveTetTriangleTable()
+
+
+class Isosurface:
+    """
+    等値面の三角形メッシュ
+    Cube.giveIsosurface()で生成する
+
+    三角形の法線(頂点の並びに対する右ねじの向き)は、値の大きい側から小さい側を向くように揃えている
+    """
+    def __init__(self, vertices, faces, isovalue=None, unit='Bohr'):
+        """
+        vertices: 頂点座標 (shape: (numVertex, 3))
+        faces: 三角形の頂点インデックス (shape: (numFace, 3))
+        isovalue: 等値面の値
+        unit: 座標の単位
+        """
+        vertices = np.asarray(vertices, dtype=np.float64)
+        faces = np.asarray(faces, dtype=np.int64)
+        if len(vertices.shape) != 2 or vertices.shape[1] != 3:
+            raise ValueError('shape of vertices must be (numVertex, 3)')
+        if len(faces.shape) != 2 or faces.shape[1] != 3:
+            raise ValueError('shape of faces must be (numFace, 3)')
+        if len(faces) > 0 and (faces.min() < 0 or faces.max() >= len(vertices)):
+            raise ValueError('faces contain invalid vertex index')
+
+        self.__vertices = vertices
+        self.__faces = faces
+        self.__isovalue = isovalue
         self.__unit = unit
 
+    def giveVertices(self):
+        return self.__vertices.copy()
+
+    def giveFaces(self):
+        return self.__faces.copy()
+
+    def giveIsovalue(self):
+        return self.__isovalue
+
+    def giveUnit(self):
+        return self.__unit
+
+    def calcArea(self):
+        """
+        等値面の面積を返す
+        """
+        v0, v1, v2 = (self.__vertices[self.__faces[:,i]] for i in range(3))
+        return 0.5 * np.sum(np.linalg.norm(np.cross(v1 - v0, v2 - v0), axis=1))
+
+    def calcVolume(self):
+        """
+        等値面に囲まれた、値がisovalueより大きい領域の体積を返す (発散定理による)
+        等値面が格子の端で切れている(閉じていない)場合は正しい値にならないので注意
+        isovalueが負で、値がisovalueより小さい領域を囲んでいる場合は負の値になる
+        """
+        v0, v1, v2 = (self.__vertices[self.__faces[:,i]] for i in range(3))
+        return np.sum(v0 * np.cross(v1, v2)) / 6
+
+    def writeObj(self, filePath):
+        """
+        Wavefront OBJ形式で書き出す
+        """
+        with open(filePath, mode='w') as f:
+            f.write('# isosurface: isovalue={} unit={}\n'.format(self.__isovalue, self.__unit))
+            np.savetxt(f, self.__vertices, fmt='v %.8f %.8f %.8f')
+            # OBJの頂点番号は1始まり
+            np.savetxt(f, self.__faces + 1, fmt='f %d %d %d')
+
+    def writePly(self, filePath, binary=True):
+        """
+        PLY形式で書き出す
+        binary: Trueならbinary_little_endian、Falseならascii
+        """
+        header = '\n'.join([
+            'ply',
+            'format {} 1.0'.format('binary_little_endian' if binary else 'ascii'),
+            'comment isosurface: isovalue={} unit={}'.format(self.__isovalue, self.__unit),
+            'element vertex {}'.format(len(self.__vertices)),
+            'property double x',
+            'property double y',
+            'property double z',
+            'element face {}'.format(len(self.__faces)),
+            'property list uchar int vertex_indices',
+            'end_header',
+        ]) + '\n'
+
+        if binary:
+            faceRecord = np.empty(len(self.__faces), dtype=[('n', 'u1'), ('index', '<i4', (3,))])
+            faceRecord['n'] = 3
+            faceRecord['index'] = self.__faces
+            with open(filePath, mode='wb') as f:
+                f.write(header.encode('ascii'))
+                f.write(self.__vertices.astype('<f8').tobytes())
+                f.write(faceRecord.tobytes())
+        else:
+            with open(filePath, mode='w') as f:
+                f.write(header)
+                np.savetxt(f, self.__vertices, fmt='%.8f %.8f %.8f')
+                np.savetxt(f, self.__faces, fmt='3 %d %d %d')
+
+
+def _giveIsolineTables():
+    """
+    marching squares の線分テーブルを作る
+    セルの頂点kがlevelより大きいなら bit k を立てたものをケース番号とし、
+    各ケースについて最大2本の線分を、セルの辺(0:下, 1:右, 2:上, 3:左)の組で返す (線分がない場合は-1)
+    return: 通常のテーブル, 鞍点のセルで中心がlevelより大きい場合のテーブル (shape: (16, 2, 2))
+    """
+    segmentDict = {
+        1: [[3,0]], 2: [[0,1]], 3: [[3,1]], 4: [[1,2]],
+        5: [[3,0],[1,2]], 6: [[0,2]], 7: [[3,2]], 8: [[2,3]],
+        9: [[0,2]], 10: [[0,1],[2,3]], 11: [[1,2]], 12: [[1,3]],
+        13: [[0,1]], 14: [[3,0]],
+    }
+    table = -np.ones((16, 2, 2), dtype=np.int64)
+    for case, segmentList in segmentDict.items():
+        table[case,:len(segmentList)] = segmentList
+    # 鞍点で中心が大きい場合は、大きい頂点同士が中心を通してつながるように切る
+    saddleTable = table.copy()
+    saddleTable[5] = [[0,1],[2,3]]
+    saddleTable[10] = [[3,0],[1,2]]
+    return table, saddleTable
+
+_isolineTable, _isolineSaddleTable = _giveIsolineTables()
+
 
 class Slice:
     """
     Cubeから生成されたスライス面のデータクラス
     """
-    def __init__(self, cube, pos=None, normal=None, pcaAuto=False):
+    def __init__(self, cube, pos=None, normal=None, pcaAuto=False, valueIndex=0, numPatch=100):
         """
         スライスデータを生成
         pos: np.ndarray or list (shape: (3,))
         normal: np.ndarray or list (shape: (3,))
         pcaAuto: 原子座標に関してPCA分析を使ってスライス面を自動決定
+        valueIndex: スライス上に補間する値のインデックス
+        numPatch: スライス上の点の数 (int: 両方向とも同じ数, (int, int): 接線ベクトル方向毎の数,
+                  'auto': 格子間隔と同程度の間隔になるように決める)
 
+        スライス面が格子面に一致する場合(法線が2つの格子ベクトルに垂直で、posが格子面上にある場合)は、
+        numPatchによらず格子点をそのままスライス上の点とし、補間を行わない
         """
+        if numPatch != 'auto':
+            if type(numPatch) is int:
+                numPatch = (numPatch, numPatch)
+            if type(numPatch) not in [list, tuple] or len(numPatch) != 2 or any([type(n) is not int or n < 2 for n in numPatch]):
+                raise ValueError('numPatch must be int (>=2), (int, int), or \'auto\'')
+
         if type(pos) is list:
             pos = np.array(pos)
         if type(normal) is list:
@@ -612,31 +1568,103 @@ class Slice:
 
         # 5.
         #
+        # スライス面が格子面に一致する場合は格子点をそのまま使う
+        self.__gridPlane = self.__giveGridPlane(cube, pos, normVector)
+        if self.__gridPlane is not None:
+            axis, index = self.__gridPlane
+            i, j = [k for k in range(3) if k != axis]
+            ngp = cube.giveNumGridPoint()
+            r = cube.giveStartingPoint() + index * svs[axis] + \
+                    np.arange(ngp[i])[:,np.newaxis,np.newaxis] * svs[i] + \
+                    np.arange(ngp[j])[np.newaxis,:,np.newaxis] * svs[j] # shape: (ni,nj,3)
+            c1, c2 = self.project3DCoordToSlice(r.reshape(-1,3))
+            self.__c1 = c1.reshape(r.shape[:2])
+            self.__c2 = c2.reshape(r.shape[:2])
+            self.__r = r
+            self.__isInside = np.ones(r.shape[:2], dtype=bool)
+            self.__value = self.calcSliceValue(cube)[:,:,valueIndex]
+            return
+
         # min~maxの間を適当な間隔で生成
-        numpatch = 100
-        c1, c2 = np.meshgrid(np.linspace(mincomponent[0], maxcomponent[0], numpatch), np.linspace(mincomponent[1], maxcomponent[1], numpatch)) # shape: (numpatch, numpatch)
-        self.__numpatch = numpatch
+        if numPatch == 'auto':
+            # 最も短い格子ベクトルと同じ程度の間隔にする
+            spacing = np.min(np.linalg.norm(svs, axis=1))
+            numPatch = tuple(int(np.ceil(w / spacing)) + 1 for w in maxcomponent - mincomponent)
+        c1, c2 = np.meshgrid(np.linspace(mincomponent[0], maxcomponent[0], numPatch[0]), np.linspace(mincomponent[1], maxcomponent[1], numPatch[1])) # shape: (numPatch2, numPatch1)
         self.__c1 = c1
         self.__c2 = c2
         # スライス上の点の座標を生成
-        r = self.convert2DCoordTo3DCoord(c1, c2).reshape(numpatch,numpatch,3) # shape: (numpatch,numpatch,3)
+        r = self.convert2DCoordTo3DCoord(c1, c2).reshape(*c1.shape,3) # shape: (numPatch2,numPatch1,3)
 
         # 6.
         #
-        # スライス上の値を計算し、Sliceを生成
-        value = cube.interpolate(r.reshape(-1,3)).reshape(numpatch, numpatch)
-
+        # cubeの範囲外の点は補間の対象から外しておく (値はnp.nan)
+        # r = startingPoint + p @ stepVector
+        p = (r.reshape(-1,3) - cube.giveStartingPoint()) @ np.linalg.inv(svs)
+        isInside = np.all((p >= 0) & (p <= cube.giveNumGridPoint()-1), axis=1)
         self.__r = r
-        self.__value = value
+        self.__isInside = isInside.reshape(c1.shape)
+        # スライス上の値を計算
+        self.__value = self.calcSliceValue(cube)[:,:,valueIndex]
+
+    def __giveGridPlane(self, cube, pos, normVector, tol=1e-6):
+        """
+        スライス面が格子面に一致するかを判定する
+        return: (axis, index): axis方向のindex番目の格子面に一致する場合, 一致しない場合はNone
+        """
+        svs = cube.giveStepVector()
+        ngp = cube.giveNumGridPoint()
+        for axis in range(3):
+            i, j = [k for k in range(3) if k != axis]
+            planeNormal = np.cross(svs[i], svs[j])
+            planeNormal = planeNormal / np.linalg.norm(planeNormal)
+            if abs(abs(planeNormal @ normVector) - 1) > tol:
+                continue
+            # posの格子座標(axis方向)が整数か
+            p = np.linalg.solve(svs.T, pos - cube.giveStartingPoint())[axis]
+            index = int(np.round(p))
+            if abs(p - index) > tol or index < 0 or index >= ngp[axis]:
+                return None
+            return axis, index
+        return None
+
+    def calcSliceValue(self, cube):
+        """
+        スライス上の点でcubeの全ての値を補間する
+        格子が同じ複数のcubeは、Cube.concatenate()で連結してから渡すと1回の補間でまとめて計算できる
+        return: shape: (numPatch2,numPatch1,valueDim)
+                (格子面に一致する場合はcubeDataのview, shape: (ni,nj,valueDim))
+        """
+        if self.__gridPlane is not None:
+            # 格子面に一致する場合は補間せずに格子点の値をそのまま返す
+            return cube.giveGridPlane(*self.__gridPlane)
+
+        isInside = self.__isInside.reshape(-1)
+        insideValue = cube.interpolate(self.__r.reshape(-1,3)[isInside])
+        value = np.full((len(isInside), insideValue.shape[1]), np.nan)
+        value[isInside] = insideValue
+        return value.reshape(*self.__isInside.shape, -1)
+
+    def giveSliceWithValue(self, value):
+        """
+        スライス面(座標)を共有し、値だけが異なるSliceを返す
+        value: shape: give3DCoord().shape[:2]
+        """
+        value = np.asarray(value, dtype=np.float64)
+        if value.shape != self.__value.shape:
+            raise ValueError('shape of value does not match the slice')
+        slice = copy.copy(self)
+        slice.__value = value
+        return slice
 
     def give3DCoord(self):
         """
-        return: shape: (numpatch,numpatch,3)
+        return: shape: (numPatch2,numPatch1,3)
         """
         return copy.deepcopy(self.__r)
     def give2DCoord(self):
         """
-        return: (shape: (numpatch,numpatch), shape: (numpatch,numpatch))
+        return: (shape: (numPatch2,numPatch1), shape: (numPatch2,numPatch1))
         """
         return copy.deepcopy(self.__c1), copy.deepcopy(self.__c2)
     def convert2DCoordTo3DCoord(self, c1, c2):
@@ -654,19 +1682,78 @@ class Slice:
         components = (r - self.__center) @ np.stack([self.__tanVector, self.__tan2Vector], axis=1) # shape: (*,2)
         return components[:,0], components[:,1]
 
+    def calcIsolines(self, level):
+        """
+        スライス上の等値線を計算する (marching squares)
+        各セルで等値線が横切る辺の組を線分とし、同じ辺上の点は1つにまとめる
+        鞍点のセル(対角の頂点だけがlevelより大きい)はセル中心の値(4頂点の平均)で接続を決める
+        nanを含むセルは除く
+
+        return: points (shape: (m,2): 等値線上の点のスライス上の2次元座標),
+                segments (shape: (k,2): 線分の両端のpointsのインデックス)
+        """
+        value = self.__value
+        n0, n1 = value.shape
+        # セルの4頂点 (0:(i,j), 1:(i,j+1), 2:(i+1,j+1), 3:(i+1,j)) の値
+        corners = np.stack([value[:-1,:-1], value[:-1,1:], value[1:,1:], value[1:,:-1]], axis=-1) # shape: (n0-1,n1-1,4)
+        isValid = np.all(~np.isnan(corners), axis=-1)
+        case = (corners > level) @ np.array([1,2,4,8])
+        case = np.where(isValid, case, 0)
+        # 鞍点のセルでセル中心がlevelより大きい場合は別の接続にする
+        isSaddleUp = np.isin(case, [5, 10]) & (np.mean(corners, axis=-1) > level)
+        table = np.where(isSaddleUp[...,np.newaxis,np.newaxis], _isolineSaddleTable[case], _isolineTable[case]) # shape: (n0-1,n1-1,2,2)
+
+        # セルの4辺 (0:下, 1:右, 2:上, 3:左) の通し番号
+        # 横の辺 (i,j)-(i,j+1): i*(n1-1)+j, 縦の辺 (i,j)-(i+1,j): n0*(n1-1)+i*n1+j
+        ii, jj = np.meshgrid(np.arange(n0-1), np.arange(n1-1), indexing='ij')
+        numHorizontal = n0 * (n1-1)
+        cellEdges = np.stack([
+            ii*(n1-1) + jj,
+            numHorizontal + ii*n1 + jj+1,
+            (ii+1)*(n1-1) + jj,
+            numHorizontal + ii*n1 + jj
+        ], axis=-1) # shape: (n0-1,n1-1,4)
+
+        table = table.reshape(-1, 2)
+        cellIndex = np.repeat(np.arange(table.shape[0] // 2), 2)
+        hasSegment = table[:,0] >= 0
+        segmentEdges = cellEdges.reshape(-1,4)[cellIndex[hasSegment][:,np.newaxis], table[hasSegment]] # shape: (k,2)
+        if len(segmentEdges) == 0:
+            return np.zeros((0,2)), np.zeros((0,2), dtype=np.int64)
+
+        # 辺上の点を線形補間で求める
+        edgeIds, segments = np.unique(segmentEdges, return_inverse=True)
+        segments = segments.reshape(-1,2)
+        isHorizontal = edgeIds < numHorizontal
+        i0 = np.where(isHorizontal, edgeIds // (n1-1), (edgeIds - numHorizontal) // n1)
+        j0 = np.where(isHorizontal, edgeIds % (n1-1), (edgeIds - numHorizontal) % n1)
+        i1 = np.where(isHorizontal, i0, i0+1)
+        j1 = np.where(isHorizontal, j0+1, j0)
+        v0 = value[i0,j0]
+        v1 = value[i1,j1]
+        t = ((level - v0) / (v1 - v0))[:,np.newaxis]
+        p0 = np.stack([self.__c1[i0,j0], self.__c2[i0,j0]], axis=1)
+        p1 = np.stack([self.__c1[i1,j1], self.__c2[i1,j1]], axis=1)
+        points = p0 + t * (p1 - p0)
+
+        return points, segments
+
     def giveSliceValue(self):
         """
-        return: shape: (numpatch,numpatch)
+        return: shape: (numPatch2,numPatch1)
         """
         return copy.deepcopy(self.__value)
     def give3DRange(self):
         """
         return: shape: (3,2) : [[xmin,xmax],[ymin,ymax],[zmin,zmax]]
         """
-        _value = self.__value.reshape(-1) # shape: (numpatch**2,)
-        _r = self.__r.reshape(-1,3)       # shape: (numpatch**2,3)
+        _value = self.__value.reshape(-1) # shape: (numPatch1*numPatch2,)
+        _r = self.__r.reshape(-1,3)       # shape: (numPatch1*numPatch2,3)
         _r_notnan = _r[~np.isnan(_value)]
-        result = np.vstack([np.min(_r, axis=0), np.max(_r, axis=0)]) # shape: (2,3)
+        if len(_r_notnan) == 0:
+            # 全ての点がnanの場合はスライス全体の範囲にする
+            _r_notnan = _r
+        result = np.vstack([np.min(_r_notnan, axis=0), np.max(_r_notnan, axis=0)]) # shape: (2,3)
         return result.T # shape: (3,2)
     def giveSliceCenter(self):
         """
@@ -894,35 +1981,38 @@ class CubeVisualizer:
 
         return datList
 
-    def giveIsosurfacePlot(self, cube, value, enableNegative=True):
+    def giveIsosurfacePlot(self, cube, value, enableNegative=True, valueIndex=0, colors=None, opacity=1.0):
         """
         等値面プロットを生成
-        return: plotly.graph_objects.Isosurface
+        等値面はCube.giveIsosurface()で三角形メッシュとして抽出し、頂点と三角形のみをplotlyに渡す
+        enableNegative: Trueなら+|value|と-|value|の2つの等値面を描く
+        colors: 等値面の色のlist (デフォルト: 正は青、負は赤)
+
+        return: list of plotly.graph_objects.Mesh3d
         """
         import plotly.graph_objects as go
 
-        # 各節点の座標を取得
-        node = cube.giveNodeCoord()
-        # 各点における値を取得
-        _, cubedata = cube.giveCubeData()
-
         if enableNegative:
-            isomax = abs(value)
-            isomin = -abs(value)
+            isovalues = [abs(value), -abs(value)]
         else:
-            isomax = isomin = value
-
-        cubeIsosurfaceDat = go.Isosurface(
-            x=node[:,:,:,0].reshape(-1),
-            y=node[:,:,:,1].reshape(-1),
-            z=node[:,:,:,2].reshape(-1),
-            value=cubedata[:,:,:,0].reshape(-1),
-            isomin=isomin,
-            isomax=isomax,
-            caps=dict(x_show=False, y_show=False, z_show=False)
-        )
+            isovalues = [value]
+        if colors is None:
+            colors = ['rgb(0,0,255)', 'rgb(255,0,0)']
 
-        return cubeIsosurfaceDat
+        datList = []
+        for isosurface, color in zip(cube.giveIsosurface(isovalues, valueIndex=valueIndex), itertools.cycle(colors)):
+            vertices = isosurface.giveVertices()
+            faces = isosurface.giveFaces()
+            meshDat = go.Mesh3d(
+                x=vertices[:,0], y=vertices[:,1], z=vertices[:,2],
+                i=faces[:,0], j=faces[:,1], k=faces[:,2],
+                color=color,
+                opacity=opacity,
+                name='isovalue={}'.format(isosurface.giveIsovalue())
+            )
+            datList.append(meshDat)
+
+        return datList
 
     def giveSlicePlot(self, slice):
         """
@@ -953,7 +2043,8 @@ class CubeVisualizer:
         return: list of plotly.graph_objects.Scatter3d, list of annotations
         """
         import plotly.graph_objects as go
-        import matplotlib.pyplot as plt
+        from scipy.sparse import coo_matrix
+        from scipy.sparse.csgraph import connected_components
 
         if cutIsolineNote is None:
             cutIsolineNote = lambda level : False
@@ -961,11 +2052,7 @@ class CubeVisualizer:
             thresholdNoteArrow = -np.inf
 
         # スライスのデータを取得
-        c1, c2 = slice.give2DCoord()
         value = slice.giveSliceValue()
-        # スライスの代表長さ
-        sliceRepLength1 = np.max(c1)-np.min(c1)
-        sliceRepLength2 = np.max(c2)-np.min(c2)
 
         # isolineのレベルを決定
         level_min = np.nanmin(value)
@@ -982,97 +2069,75 @@ class CubeVisualizer:
                         stepIsoline
                     )
 
-        #
-        # matplotのcontourを使って座標を取得する
-        isolines = plt.contour(c1, c2, value, levels=levels)
-        plt.close() # これがないとplt.contour()が描画されるのでそれを防ぐ
-        # 等値線の座標を折れ線グラフで描画する
+        # 等値線はレベル毎に1つのtraceにまとめる (線分の間はnanで区切る)
         isolineDatList = []
         annotationList = []
-        for i in range(len(isolines.collections)):
-            paths = isolines.collections[i].get_paths()
-            for j in range(len(paths)):
-                isoline_c1 = paths[j].vertices[:, 0] # shape: (*,)
-                isoline_c2 = paths[j].vertices[:, 1] # shape: (*,)
-                r = slice.convert2DCoordTo3DCoord(isoline_c1, isoline_c2) # shape: (*,3)
-                x = r[:,0]
-                y = r[:,1]
-                z = r[:,2]
-                level = levels[i]
-                trace = go.Scatter3d(x=x, y=y, z=z, mode='lines', line=dict(width=2, cmin=levels[0], cmax=levels[-1], color=np.ones_like(x)*level), showlegend=False)
-                isolineDatList.append(trace)
-
-                # annotation
-                if cutIsolineNote(level):
-                    continue
-                c1i = isoline_c1[0]
-                c2i = isoline_c2[0]
-                c1f = isoline_c1[-1]
-                c2f = isoline_c2[-1]
-                length = np.sum(np.sqrt(np.diff(isoline_c1)**2 + np.diff(isoline_c2)**2))
-                isLooped = (abs(c1i-c1f)<1e-10*sliceRepLength1) and (abs(c2i-c2f)<1e-10*sliceRepLength2)
+        for level in levels:
+            points, segments = slice.calcIsolines(level)
+            if len(segments) == 0:
+                continue
+            r = slice.convert2DCoordTo3DCoord(points[:,0], points[:,1]) # shape: (m,3)
+            lineR = np.concatenate([r[segments], np.full((len(segments),1,3), np.nan)], axis=1).reshape(-1,3) # shape: (3k,3)
+            x = lineR[:,0]
+            y = lineR[:,1]
+            z = lineR[:,2]
+            trace = go.Scatter3d(x=x, y=y, z=z, mode='lines', line=dict(width=2, cmin=levels[0], cmax=levels[-1], color=np.ones_like(x)*level), showlegend=False)
+            isolineDatList.append(trace)
+
+            # annotation
+            if cutIsolineNote(level):
+                continue
+            # つながった線分を1本の等値線とし、長さと閉じているかを求める
+            numPoint = len(points)
+            graph = coo_matrix((np.ones(len(segments)), (segments[:,0], segments[:,1])), shape=(numPoint, numPoint))
+            numLine, label = connected_components(graph, directed=False)
+            segmentLength = np.linalg.norm(points[segments[:,1]] - points[segments[:,0]], axis=1)
+            length = np.bincount(label[segments[:,0]], weights=segmentLength, minlength=numLine)
+            degree = np.bincount(segments.reshape(-1), minlength=numPoint)
+            isLooped = np.bincount(label, weights=(degree != 2), minlength=numLine) == 0
+            # レベル表記の位置: 閉じていない等値線は端点、閉じている等値線は任意の点
+            order = np.lexsort((np.arange(numPoint), degree != 1, label))
+            notePoint = order[np.searchsorted(label[order], np.arange(numLine))]
+            showArrow = (length < thresholdNoteArrow) & isLooped
+            for (xi, yi, zi), arrow in zip(r[notePoint], showArrow):
                 annotationList.append(dict(
-                    text=level, x=x[0], y=y[0], z=z[0], font=dict(color='black'),
-                    showarrow=bool((length<thresholdNoteArrow) and isLooped),
+                    text=level, x=xi, y=yi, z=zi, font=dict(color='black'),
+                    showarrow=bool(arrow),
                     bgcolor='white', opacity=0.8
                 ))
 
         return isolineDatList, annotationList
 
+def convertCubeFileToBinary(cubeFile, binaryFile, memmapPath=None, **saveArgs):
+    """
+    cubeファイルをHDF5ファイルに変換する
+    memmapPath: 指定した場合は読み込んだ格子データをこのファイルのnp.memmapに置く(大きなcube用)
+    saveArgs: Cube.saveBinaryの引数 (dtype, compression, ...)
+    """
+    cube = Cube(filePath=cubeFile, memmapPath=memmapPath)
+    cube.saveBinary(binaryFile, **saveArgs)
+
+
 """
 上のクラスを統合して、cubeファイルのコンター図をプロットするための関数
 """
-def visualizeCubeSlice(cube=None, cubeFile=None, outFile=None, slicePos=None, sliceNormal=None, pcaAuto=None, cmin=None, cmax=None, numIsoline=None, stepIsoline=None, cutIsolineNote=None, thresholdNoteArrow=None, cameraZoom=100, cameraRotate=0, printParam=False):
-    import plotly.graph_objects as go
-
-    # load cube data
-    if cube is None:
-        cube = Cube(filePath=cubeFile)
-
-    node = cube.giveNodeCoord()
-    xmin = node[:,:,:,0].min()
-    xmax = node[:,:,:,0].max()
-    ymin = node[:,:,:,1].min()
-    ymax = node[:,:,:,1].max()
-    zmin = node[:,:,:,2].min()
-    zmax = node[:,:,:,2].max()
-
-    cvis = CubeVisualizer()
-
-    datList = []
-
-    # set molecule plot
-    if cube.giveAtomData()[0] is not None:
-        molplotDatList = cvis.giveMoleculeSurfacePlot(cube, scale=1.5)
-        datList.extend(molplotDatList)
-
-    # set slice plot
-    slice = Slice(cube, pos=slicePos, normal=sliceNormal, pcaAuto=pcaAuto)
-    sliceDat = cvis.giveSlicePlot(slice)
-    isolineDatList, annotationList = cvis.giveIsolinesPlot(slice, numIsoline=numIsoline, stepIsoline=stepIsoline, cutIsolineNote=cutIsolineNote, thresholdNoteArrow=thresholdNoteArrow)
-
-    sliceDat['cmin'] = cmin
-    sliceDat['cmax'] = cmax
-    sliceDat['colorscale'] = 'rainbow'
-    sliceDat['lighting'] = {'ambient':1.0}
-    for d in isolineDatList:
-        d['line']['colorscale'] = [[0,'rgb(0,0,0)'],[1,'rgb(0,0,0)']]
-
-    datList.append(sliceDat)
-    datList.extend(isolineDatList)
+def _giveSliceLayout(cube, slice, cameraZoom=100, cameraRotate=0):
+    """
+    スライスの図のレイアウト(軸の範囲、カメラ)を生成
+    return: layout (dict), cameraPos, cameraUp
+    """
+    (xmin, xmax), (ymin, ymax), (zmin, zmax) = cube.giveNodeCoordRange()
 
     # set camera parameter
     # convert to rad from deg
     cameraRotate = cameraRotate / 180 * np.pi
-    sliceCenter = slice.giveSliceCenter()
     sliceNormal = slice.giveSliceNormalVector()
     sliceTangent = slice.giveSliceTangentVector()
     cameraPos = sliceNormal * (16.8 / np.abs(xmax-xmin) * 100 / cameraZoom)
     # rotation around normal axis
     cameraUp = sliceTangent * np.cos(cameraRotate) + sliceNormal * (sliceNormal@sliceTangent) * (1-np.cos(cameraRotate)) + np.cross(sliceNormal,sliceTangent)*np.sin(cameraRotate)
 
-    fig = go.Figure(data=datList)
-    fig.update_layout(
+    layout = dict(
         scene=dict(
             xaxis=dict(range=(xmin, xmax), showgrid=False, showticklabels=False, showbackground=False, title=''),
             yaxis=dict(range=(ymin, ymax), showgrid=False, showticklabels=False, showbackground=False, title=''),
@@ -1082,14 +2147,64 @@ def visualizeCubeSlice(cube=None, cubeFile=None, outFile=None, slicePos=None, sl
             camera=dict(
                 eye=dict(x=cameraPos[0], y=cameraPos[1], z=cameraPos[2]),
                 up=dict(x=cameraUp[0], y=cameraUp[1], z=cameraUp[2])
-            ),
-            annotations=annotationList
+            )
         ),
         margin=dict(
             l=20, r=20, t=10, b=10
         )
     )
 
+    return layout, cameraPos, cameraUp
+
+def _giveSliceFigure(slice, baseDatList, layout, cmin=None, cmax=None, numIsoline=None, stepIsoline=None, cutIsolineNote=None, thresholdNoteArrow=None):
+    """
+    スライス(と等値線)の図を生成
+    baseDatList: スライス以外に描画するもの(分子など)
+    layout: _giveSliceLayout()で生成したレイアウト
+    return: plotly.graph_objects.Figure
+    """
+    import plotly.graph_objects as go
+
+    cvis = CubeVisualizer()
+
+    datList = list(baseDatList)
+
+    # set slice plot
+    sliceDat = cvis.giveSlicePlot(slice)
+    isolineDatList, annotationList = cvis.giveIsolinesPlot(slice, numIsoline=numIsoline, stepIsoline=stepIsoline, cutIsolineNote=cutIsolineNote, thresholdNoteArrow=thresholdNoteArrow)
+
+    sliceDat['cmin'] = cmin
+    sliceDat['cmax'] = cmax
+    sliceDat['colorscale'] = 'rainbow'
+    sliceDat['lighting'] = {'ambient':1.0}
+    for d in isolineDatList:
+        d['line']['colorscale'] = [[0,'rgb(0,0,0)'],[1,'rgb(0,0,0)']]
+
+    datList.append(sliceDat)
+    datList.extend(isolineDatList)
+
+    fig = go.Figure(data=datList)
+    fig.update_layout(layout)
+    fig.update_layout(scene=dict(annotations=annotationList))
+
+    return fig
+
+def visualizeCubeSlice(cube=None, cubeFile=None, outFile=None, slicePos=None, sliceNormal=None, pcaAuto=None, cmin=None, cmax=None, numIsoline=None, stepIsoline=None, cutIsolineNote=None, thresholdNoteArrow=None, cameraZoom=100, cameraRotate=0, printParam=False):
+    # load cube data
+    if cube is None:
+        cube = Cube(filePath=cubeFile)
+
+    datList = []
+
+    # set molecule plot
+    if cube.giveAtomData()[0] is not None:
+        molplotDatList = CubeVisualizer().giveMoleculeSurfacePlot(cube, scale=1.5)
+        datList.extend(molplotDatList)
+
+    slice = Slice(cube, pos=slicePos, normal=sliceNormal, pcaAuto=pcaAuto)
+    layout, cameraPos, cameraUp = _giveSliceLayout(cube, slice, cameraZoom=cameraZoom, cameraRotate=cameraRotate)
+    fig = _giveSliceFigure(slice, datList, layout, cmin=cmin, cmax=cmax, numIsoline=numIsoline, stepIsoline=stepIsoline, cutIsolineNote=cutIsolineNote, thresholdNoteArrow=thresholdNoteArrow)
+
     if type(outFile) is str:
         fig.write_image(outFile)
     else:
@@ -1103,9 +2218,121 @@ def visualizeCubeSlice(cube=None, cubeFile=None, outFile=None, slicePos=None, sl
         print('maxValue: {}'.format(np.nanmax(v)))
         print('cmin: {}'.format(cmin))
         print('cmax: {}'.format(cmax))
-        print('sliceCenter: {}'.format(sliceCenter))
-        print('sliceNormal: {}'.format(sliceNormal))
-        print('sliceTangent: {}'.format(sliceTangent))
+        print('sliceCenter: {}'.format(slice.giveSliceCenter()))
+        print('sliceNormal: {}'.format(slice.giveSliceNormalVector()))
+        print('sliceTangent: {}'.format(slice.giveSliceTangentVector()))
         print('cameraPos: {}'.format(cameraPos))
         print('cameraUp: {}'.format(cameraUp))
 
+def visualizeCubeSlices(cubes=None, cubeFiles=None, outFiles=None, valueIndex=None, slicePos=None, sliceNormal=None, pcaAuto=None, cmin=None, cmax=None, numIsoline=None, stepIsoline=None, cutIsolineNote=None, thresholdNoteArrow=None, cameraZoom=100, cameraRotate=0, groupSize=16, numProcess=1):
+    """
+    格子と分子構造が共通する複数のcube(またはその複数の値)のスライス図をまとめて出力する
+    (軌道のセットや反応経路上の各点など)
+
+    スライス面、分子の描画オブジェクト、カメラは最初のcubeから1回だけ生成し、全ての図で共有する
+    スライス上の値はgroupSize個のcubeを連結して1回の補間でまとめて計算する
+    描画はnumProcess個のプロセスで並列に行い、画像出力用のプロセス(kaleido)は各プロセスで1つを使い回す
+
+    cubes, cubeFiles: Cubeのlist, またはcubeファイルのlist (cubeFilesは読み込みながら処理する)
+    outFiles: 出力ファイルのlist (cube, 値の順)
+              またはformat文字列 ({index}: 図の通し番号, {cube}: cubeの番号, {value}: 値のインデックス, {name}: 値の名前)
+    valueIndex: 描画する値のインデックス (int または list of int, Noneの場合は全て)
+    cutIsolineNote: numProcess > 1 の場合は、pickle可能な関数(モジュールのトップレベルで定義したもの)にすること
+    その他の引数はvisualizeCubeSliceと同じ
+    return: list of [outFile, minValue, maxValue]
+    """
+    if (cubes is None) == (cubeFiles is None):
+        raise ValueError('either cubes or cubeFiles must be given')
+    if type(groupSize) is not int or groupSize < 1:
+        raise ValueError('groupSize must be a positive int')
+    if type(numProcess) is not int or numProcess < 1:
+        raise ValueError('numProcess must be a positive int')
+    if type(outFiles) not in [list, tuple, str]:
+        raise TypeError('outFiles must be list of str or format str')
+
+    if cubes is not None:
+        numCube = len(cubes)
+        giveCube = lambda i: cubes[i]
+    else:
+        numCube = len(cubeFiles)
+        giveCube = lambda i: Cube(filePath=cubeFiles[i])
+    if numCube == 0:
+        return []
+
+    # 共通のスライス面、分子、カメラ
+    refCube = giveCube(0)
+    baseDatList = []
+    if refCube.giveAtomData()[0] is not None:
+        baseDatList = [d.to_plotly_json() for d in CubeVisualizer().giveMoleculeSurfacePlot(refCube, scale=1.5)]
+    slice = Slice(refCube, pos=slicePos, normal=sliceNormal, pcaAuto=pcaAuto)
+    layout, _, _ = _giveSliceLayout(refCube, slice, cameraZoom=cameraZoom, cameraRotate=cameraRotate)
+    figureSpec = dict(
+        slice=slice, baseDatList=baseDatList, layout=layout,
+        cmin=cmin, cmax=cmax, numIsoline=numIsoline, stepIsoline=stepIsoline,
+        cutIsolineNote=cutIsolineNote, thresholdNoteArrow=thresholdNoteArrow
+    )
+
+    def iterJobs():
+        """
+        groupSize個ずつcubeを読み込み、スライス上の値をまとめて補間して、図1枚ずつのジョブを生成する
+        """
+        index = 0
+        for start in range(0, numCube, groupSize):
+            group = [refCube if i == 0 else giveCube(i) for i in range(start, min(start+groupSize, numCube))]
+            for cube in group:
+                if not refCube.isSameGrid(cube):
+                    raise ValueError('grids of cubes do not match (startingPoint, stepVector, numGridPoint)')
+            values = slice.calcSliceValue(group[0].concatenate(group[1:]))
+
+            offset = 0
+            for i, cube in enumerate(group, start=start):
+                names = cube.giveValueNames()
+                valueDim = len(names)
+                for k in (range(valueDim) if valueIndex is None else ([valueIndex] if type(valueIndex) is int else valueIndex)):
+                    if type(k) is not int or k < 0 or k >= valueDim:
+                        raise ValueError('valueIndex is out of range')
+                    if type(outFiles) is str:
+                        outFile = outFiles.format(index=index, cube=i, value=k, name=names[k])
+                    else:
+                        if index >= len(outFiles):
+                            raise ValueError('number of outFiles is smaller than number of figures')
+                        outFile = outFiles[index]
+                    yield values[:,:,offset+k], outFile
+                    index += 1
+                offset += valueDim
+
+    if numProcess == 1:
+        _initSliceWorker(figureSpec)
+        return [_renderSliceJob(job) for job in iterJobs()]
+    with ProcessPoolExecutor(max_workers=numProcess, initializer=_initSliceWorker, initargs=(figureSpec,)) as executor:
+        return list(executor.map(_renderSliceJob, iterJobs()))
+
+_sliceWorkerSpec = None
+
+def _initSliceWorker(figureSpec):
+    global _sliceWorkerSpec
+    _sliceWorkerSpec = figureSpec
+    # kaleido(v1以降)は常駐させておくと図毎にブラウザを起動しなくて済む
+    # (v0.2はプロセス毎に1つのkaleidoを使い回すので何もしなくてよい)
+    try:
+        import kaleido
+        kaleido.start_sync_server(silence_warnings=True)
+    except (ImportError, AttributeError, RuntimeError):
+        pass
+
+def _renderSliceJob(job):
+    """
+    スライス上の値1組から図を生成し、ファイルに出力する
+    job: (value (shape: Slice.give3DCoord().shape[:2]), outFile)
+    return: [outFile, minValue, maxValue]
+    """
+    value, outFile = job
+    spec = _sliceWorkerSpec
+    slice = spec['slice'].giveSliceWithValue(value)
+    fig = _giveSliceFigure(
+        slice, spec['baseDatList'], spec['layout'],
+        cmin=spec['cmin'], cmax=spec['cmax'], numIsoline=spec['numIsoline'], stepIsoline=spec['stepIsoline'],
+        cutIsolineNote=spec['cutIsolineNote'], thresholdNoteArrow=spec['thresholdNoteArrow']
+    )
+    fig.write_image(outFile)
+    return [outFile, float(np.nanmin(value)), float(np.nanmax(value))]
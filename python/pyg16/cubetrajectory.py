@@ -0,0 +1,267 @@
+import os
+
+import numpy as np
+
+from pyg16.cube import Cube
+
+class CubeTrajectory:
+    """
+    格子が共通する複数フレームのcubeデータ(MDのスナップショット毎の電子密度やESPなど)をまとめて扱うクラス
+
+    格子と原子番号は1つだけ持ち、格子データは全フレームを1つの配列 (shape: (numFrame, na, nb, nc, valueDim)) に格納する
+    原子座標はフレーム毎に持つ
+    memmapPathを指定した場合は格子データをnp.memmapとしてファイルに置く
+    フレームの追加に備えて配列には余裕を持たせておき、足りなくなったら2倍に広げる
+    """
+    def __init__(self, grid, valueDim=None, valueNames=None, memmapPath=None, capacity=16):
+        """
+        grid: 格子、原子番号、単位の基準にするCube (格子データはフレームとして追加しない)
+        valueDim: 1フレームあたりの値の数 (指定しない場合はgridと同じ)
+        valueNames: 値の名前 (指定しない場合はgridと同じ)
+        memmapPath: 格子データを置くファイル (指定しない場合はメモリ上に置く)
+        capacity: 最初に確保するフレーム数
+        """
+        if not isinstance(grid, Cube):
+            raise TypeError('grid must be Cube')
+        if type(capacity) is not int or capacity < 1:
+            raise ValueError('capacity must be a positive int')
+        if valueDim is None:
+            valueDim = len(grid.giveValueNames())
+            if valueNames is None:
+                valueNames = grid.giveValueNames()
+        if type(valueDim) is not int or valueDim < 1:
+            raise ValueError('valueDim must be a positive int')
+        if valueNames is None:
+            valueNames = ['value{}'.format(i) for i in range(valueDim)]
+        if len(valueNames) != valueDim:
+            raise ValueError('The length of valueNames does not fit valueDim')
+
+        self.__startingPoint = grid.giveStartingPoint()
+        self.__stepVector = grid.giveStepVector()
+        self.__numGridPoint = grid.giveNumGridPoint()
+        self.__unit = grid.giveUnit()
+        self.__atomicNumData, atomXYZData = grid.giveAtomData()
+        self.__valueDim = valueDim
+        self.__valueNames = list(valueNames)
+        self.__memmapPath = memmapPath
+
+        self.__numFrame = 0
+        self.__frames = self.__allocate(capacity)
+        # フレーム毎の原子座標 (原子データがない場合はNone)
+        self.__atomXYZFrames = None if atomXYZData is None else np.empty((capacity, *atomXYZData.shape))
+        self.__defaultAtomXYZ = atomXYZData
+
+    def __allocate(self, capacity):
+        """
+        capacityフレーム分の配列を確保する (既存のフレームは引き継ぐ)
+        """
+        shape = (capacity, *self.__numGridPoint, self.__valueDim)
+        if self.__memmapPath is None:
+            frames = np.empty(shape)
+            if self.__numFrame > 0:
+                frames[:self.__numFrame] = self.__frames[:self.__numFrame]
+            return frames
+
+        # memmapの場合はファイルを伸ばして開き直す (既存のフレームはそのまま残る)
+        if self.__numFrame > 0:
+            self.__frames.flush()
+        with open(self.__memmapPath, mode='ab' if self.__numFrame > 0 else 'wb'):
+            pass
+        os.truncate(self.__memmapPath, int(np.prod(shape)) * np.dtype(np.float64).itemsize)
+        return np.memmap(self.__memmapPath, dtype=np.float64, mode='r+', shape=shape)
+
+    def __reserve(self, numFrame):
+        """
+        numFrameフレーム分の領域を確保する
+        """
+        capacity = len(self.__frames)
+        if numFrame <= capacity:
+            return
+        capacity = max(numFrame, 2 * capacity)
+        self.__frames = self.__allocate(capacity)
+        if self.__atomXYZFrames is not None:
+            atomXYZFrames = np.empty((capacity, *self.__atomXYZFrames.shape[1:]))
+            atomXYZFrames[:self.__numFrame] = self.__atomXYZFrames[:self.__numFrame]
+            self.__atomXYZFrames = atomXYZFrames
+
+    def appendFrame(self, frame, atomXYZData=None):
+        """
+        フレームを1つ追加する
+        frame: Cube (格子が一致するもの) または np.ndarray (shape: (na, nb, nc, valueDim) or (na, nb, nc)(valueDim==1))
+        atomXYZData: このフレームの原子座標 (指定しない場合は、frameがCubeならその原子座標、それ以外は基準の原子座標)
+        """
+        if isinstance(frame, Cube):
+            if not self.__isSameGrid(frame):
+                raise ValueError('grid of frame does not match (startingPoint, stepVector, numGridPoint, unit)')
+            if atomXYZData is None:
+                atomXYZData = frame.giveAtomData()[1]
+            frameData = frame.giveCubeData()[1]
+        elif type(frame) is np.ndarray:
+            frameData = frame
+        else:
+            raise TypeError('frame must be Cube or np.ndarray')
+
+        if frameData.shape == tuple(self.__numGridPoint) and self.__valueDim == 1:
+            frameData = frameData[..., np.newaxis]
+        if frameData.shape != (*self.__numGridPoint, self.__valueDim):
+            raise ValueError('shape of frame must be (na, nb, nc, valueDim)')
+
+        if self.__atomXYZFrames is not None:
+            if atomXYZData is None:
+                atomXYZData = self.__defaultAtomXYZ
+            atomXYZData = np.asarray(atomXYZData, dtype=np.float64)
+            if atomXYZData.shape != self.__defaultAtomXYZ.shape:
+                raise ValueError('shape of atomXYZData does not match the number of atoms')
+
+        self.__reserve(self.__numFrame + 1)
+        self.__frames[self.__numFrame] = frameData
+        if self.__atomXYZFrames is not None:
+            self.__atomXYZFrames[self.__numFrame] = atomXYZData
+        self.__numFrame += 1
+
+    def appendCubeFiles(self, filePaths):
+        """
+        cubeファイルを1つずつ読み込んでフレームとして追加する
+        (読み込んだCubeはフレームの追加後に破棄するので、メモリには1フレーム分しか載らない)
+        """
+        if type(filePaths) is str:
+            filePaths = [filePaths]
+        for filePath in filePaths:
+            cube = Cube(filePath=filePath)
+            cube.setUnit(self.__unit)
+            self.appendFrame(cube)
+
+    def __isSameGrid(self, cube):
+        return cube.giveUnit() == self.__unit and \
+                np.array_equal(cube.giveNumGridPoint(), self.__numGridPoint) and \
+                np.allclose(cube.giveStartingPoint(), self.__startingPoint) and \
+                np.allclose(cube.giveStepVector(), self.__stepVector)
+
+    def giveNumFrame(self):
+        return self.__numFrame
+
+    def giveFrames(self):
+        """
+        全フレームの格子データを返す (コピーせずにviewを返す)
+        return: np.ndarray (shape: (numFrame, na, nb, nc, valueDim))
+        """
+        return self.__frames[:self.__numFrame]
+
+    def giveAtomXYZFrames(self):
+        """
+        全フレームの原子座標を返す
+        return: np.ndarray (shape: (numFrame, numAtom, 3)), 原子データがない場合はNone
+        """
+        if self.__atomXYZFrames is None:
+            return None
+        return self.__atomXYZFrames[:self.__numFrame].copy()
+
+    def __newCube(self, cubeData, atomXYZData):
+        return Cube(
+            startingPoint=self.__startingPoint.copy(),
+            stepVector=self.__stepVector.copy(),
+            numGridPoint=self.__numGridPoint.copy(),
+            cubeData=cubeData,
+            valueDim=self.__valueDim,
+            valueNames=list(self.__valueNames),
+            atomicNumData=None if atomXYZData is None else self.__atomicNumData.copy(),
+            atomXYZData=None if atomXYZData is None else np.array(atomXYZData),
+            unit=self.__unit
+        )
+
+    def giveFrame(self, index, copy=False):
+        """
+        index番目のフレームをCubeとして返す
+        copy: Falseの場合は格子データをコピーせず、読み込み専用のviewを持つCubeを返す
+              (f += 1のような in-place の演算はエラーになる。書き換える場合はcopy=Trueにする)
+        """
+        if type(index) is not int:
+            raise TypeError('index must be int')
+        if index < 0:
+            index += self.__numFrame
+        if index < 0 or index >= self.__numFrame:
+            raise IndexError('frame index is out of range')
+        atomXYZData = None if self.__atomXYZFrames is None else self.__atomXYZFrames[index]
+        if copy:
+            return self.__newCube(np.array(self.__frames[index]), atomXYZData)
+        # memmapの場合もview(np.ndarray)にすればコピーせずにCubeに渡せる
+        # 返したCubeへの書き込みがtrajectory(やmemmapのファイル)に反映されないように読み込み専用にする
+        cubeData = self.__frames[index].view(np.ndarray)
+        cubeData.flags.writeable = False
+        return self.__newCube(cubeData, atomXYZData)
+
+    def __checkFrameIndex(self, frames):
+        """
+        framesをフレーム番号の配列に変換する (Noneの場合は全て, sliceも可)
+        """
+        if frames is None:
+            return np.arange(self.__numFrame)
+        if type(frames) is slice:
+            return np.arange(self.__numFrame)[frames]
+        frames = np.asarray(frames, dtype=np.int64).reshape(-1)
+        if np.any(frames < 0) or np.any(frames >= self.__numFrame):
+            raise IndexError('frame index is out of range')
+        return frames
+
+    def calcStatistics(self, frames=None, ddof=0, frameBlockSize=16):
+        """
+        格子点毎に、フレーム間の平均と分散を計算する
+        フレームをframeBlockSize個ずつ読み、ブロック毎の平均と偏差平方和を合成する (Chanの方法)
+        memmapの場合でも一度にframeBlockSizeフレーム分しかメモリに載らない
+
+        frames: 対象とするフレーム番号 (list, slice, Noneの場合は全て)
+        ddof: 分散の自由度の補正 (0: 標本分散, 1: 不偏分散)
+        return: 平均のCube, 分散のCube (原子座標はフレーム間の平均)
+        """
+        if type(frameBlockSize) is not int or frameBlockSize < 1:
+            raise ValueError('frameBlockSize must be a positive int')
+        frames = self.__checkFrameIndex(frames)
+        numFrame = len(frames)
+        if numFrame <= ddof:
+            raise ValueError('number of frames must be larger than ddof')
+
+        shape = (*self.__numGridPoint, self.__valueDim)
+        mean = np.zeros(shape)
+        m2 = np.zeros(shape)
+        count = 0
+        for start in range(0, numFrame, frameBlockSize):
+            index = frames[start:start+frameBlockSize]
+            if np.all(np.diff(index) == 1):
+                # 連続したフレームはsliceで読む (memmapのコピーを避ける)
+                block = np.asarray(self.__frames[index[0]:index[-1]+1])
+            else:
+                block = np.asarray(self.__frames[index])
+            blockCount = len(index)
+            blockMean = np.mean(block, axis=0)
+            blockM2 = np.sum((block - blockMean)**2, axis=0)
+
+            delta = blockMean - mean
+            total = count + blockCount
+            mean += delta * (blockCount / total)
+            m2 += blockM2 + delta**2 * (count * blockCount / total)
+            count = total
+
+        atomXYZData = None
+        if self.__atomXYZFrames is not None:
+            atomXYZData = np.mean(self.__atomXYZFrames[frames], axis=0)
+
+        return self.__newCube(mean, atomXYZData), self.__newCube(m2 / (count - ddof), atomXYZData)
+
+    def calcMean(self, frames=None, frameBlockSize=16):
+        """
+        格子点毎のフレーム間の平均をCubeとして返す
+        """
+        return self.calcStatistics(frames=frames, frameBlockSize=frameBlockSize)[0]
+
+    def calcVariance(self, frames=None, ddof=0, frameBlockSize=16):
+        """
+        格子点毎のフレーム間の分散をCubeとして返す
+        """
+        return self.calcStatistics(frames=frames, ddof=ddof, frameBlockSize=frameBlockSize)[1]
+
+    def flush(self):
+        """
+        memmapの場合は内容をファイルに書き出す
+        """
+        if isinstance(self.__frames, np.memmap):
+            self.__frames.flush()
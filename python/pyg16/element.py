@@ -0,0 +1,129 @@
+import os
+
+class ElementTable:
+    """
+    元素記号、原子番号、基底関数の数の対応表
+
+    element.dat (bash/utl/element.shと共用)を1回だけ読み込み、
+    元素記号 <-> 原子番号、(基底関数, dtype, ftype) -> 各元素の基底関数の数を辞書として持つ
+    """
+    __dataPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'element.dat')
+
+    # 周期表にない原子番号の系統名 (例: 119 -> Uue)
+    __systematicChars = 'nubtqphsoe'
+
+    # 基底関数の数の種類 -> element.datの値の位置
+    __numOfIndex = {
+        'basis': 0,
+        'primitive-basis': 1,
+        'cartesian-basis': 2,
+    }
+
+    def __init__(self, dataPath=None):
+        """
+        dataPath: 対応表のファイル (指定しない場合はpyg16/element.dat)
+        """
+        if dataPath is None:
+            dataPath = self.__dataPath
+
+        self.__symbols = [None]   # 原子番号 -> 元素記号 (0番目は使わない)
+        self.__atomicNums = {}    # 元素記号 -> 原子番号
+        self.__basisDict = {}     # (基底関数, dtype, ftype) (大文字) -> 原子番号順の(基底関数の数, primitive, cartesian)のリスト
+
+        with open(dataPath, mode='r') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) == 0 or fields[0].startswith('#'):
+                    continue
+                if fields[0] == 'symbol':
+                    self.__symbols += fields[1:]
+                    self.__atomicNums = {symbol: i for i, symbol in enumerate(self.__symbols) if i > 0}
+                elif fields[0] == 'basis':
+                    key = tuple(field.upper() for field in fields[1:4])
+                    self.__basisDict[key] = [tuple(None if v == 'nan' else int(v) for v in values.split(',')) for values in fields[4:]]
+
+    def giveNumElement(self):
+        """
+        対応表に含まれる元素の数を返す
+        """
+        return len(self.__symbols) - 1
+
+    def giveSymbol(self, atomicNum):
+        """
+        原子番号から元素記号を返す
+        周期表にない原子番号の場合は系統名を返す (例: 119 -> Uue)
+        """
+        if type(atomicNum) is not int or atomicNum < 0:
+            raise ValueError('atomicNum must be a non-negative int')
+        if 0 < atomicNum < len(self.__symbols):
+            return self.__symbols[atomicNum]
+        return ''.join(self.__systematicChars[int(c)] for c in str(atomicNum)).capitalize()
+
+    def giveAtomicNum(self, symbol):
+        """
+        元素記号から原子番号を返す
+        系統名(例: Uue)の場合はそれが表す原子番号を返し、どちらでもない場合はNoneを返す
+        """
+        if symbol in self.__atomicNums:
+            return self.__atomicNums[symbol]
+        lowerSymbol = symbol.lower()
+        if len(lowerSymbol) > 0 and all(c in self.__systematicChars for c in lowerSymbol):
+            return int(''.join(str(self.__systematicChars.index(c)) for c in lowerSymbol))
+        return None
+
+    def giveNumBasis(self, symbol, basis, dtype='5D', ftype='7F', numOf='basis'):
+        """
+        元素の基底関数の数を返す (対応表にない場合はNone)
+
+        basis: 基底関数の名前 (大文字小文字は区別しない)
+        dtype: '5D' or '6D'
+        ftype: '7F' (現在は7Fのみ)
+        numOf: 'basis', 'primitive-basis', 'cartesian-basis'
+        """
+        if numOf not in self.__numOfIndex:
+            raise ValueError('numOf must be one of {}'.format(list(self.__numOfIndex.keys())))
+        atomicNum = self.__atomicNums.get(symbol)
+        values = self.__basisDict.get((basis.upper(), dtype.upper(), ftype.upper()))
+        if atomicNum is None or values is None:
+            return None
+        return values[atomicNum-1][self.__numOfIndex[numOf]]
+
+    def giveBasisNames(self):
+        """
+        対応表に含まれる基底関数の名前のリストを返す (大文字)
+        """
+        return sorted(set(basis for basis, _, _ in self.__basisDict.keys()))
+
+    def expandSymbolList(self, string):
+        """
+        元素の範囲の指定を元素記号のリストに展開する
+        'H-Ar,Ga-Kr,Fe,I' -> ['H', 'He', ..., 'Ar', 'Ga', ..., 'Kr', 'Fe', 'I']
+        範囲の始点を省略した場合はH、終点を省略した場合は最後の元素からとする ('-C', 'Og-')
+        """
+        symbolList = []
+        for item in string.replace(',', ' ').split():
+            start, _, stop = item.partition('-')
+            start = self.__giveRangeEnd(start, 1)
+            stop = self.__giveRangeEnd(stop, self.giveNumElement()) if '-' in item else start
+            symbolList += [self.giveSymbol(i) for i in range(start, stop+1)]
+        return symbolList
+
+    def __giveRangeEnd(self, symbol, default):
+        if symbol == '':
+            return default
+        atomicNum = self.giveAtomicNum(symbol)
+        if atomicNum is None:
+            raise ValueError('unknown element symbol: {}'.format(symbol))
+        return atomicNum
+
+# 共有する対応表 (giveElementTable()で初めて要求された時に読み込む)
+_elementTable = None
+
+def giveElementTable():
+    """
+    共有の対応表(ElementTable)を返す
+    """
+    global _elementTable
+    if _elementTable is None:
+        _elementTable = ElementTable()
+    return _elementTable
@@ -1,73 +1,166 @@
+import os
 import re
 import copy
+import json
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
-from scipy.spatial.distance import squareform
 
-from pyg16.basisfunction import GTOBasis
+from pyg16.basisfunction import GTOBasis, BasisSet, _cartesianPowers
+from pyg16.fchkcache import FchkCache
+from pyg16.cube import Cube
 
 class Fchk:
-    def __init__(self, filePath):
+    # 複数行レコードの1行あたりの要素数と1要素の幅(文字数)
+    # R: 5E16.8, I: 6I12, C: 5A12
+    __recordFormat = {
+        'R': (5, 16),
+        'I': (6, 12),
+        'C': (5, 12),
+    }
+
+    def __init__(self, filePath, useCache=False, cacheDir=None, cacheSizeLimit=None):
         """
         load fchk file
+
+        ファイルを1回だけ走査し、各レコードのヘッダーとデータ部分の位置(offset)の索引を作る
+        単行レコードの値はこの時点で変換するが、
+        複数行レコード(配列)はgiveValue()で初めて要求された時にnp.ndarrayへ変換する
+
+        useCache: Trueの場合、全レコードを変換してバイナリのキャッシュに保存し、
+                  次回以降はキャッシュの配列をmemmapで開く (FchkCacheを参照)
+        cacheDir: キャッシュの保存先
+        cacheSizeLimit: キャッシュ全体のサイズの上限(byte)
+        """
+        self.__filePath = filePath
+
+        if useCache:
+            cache = FchkCache(cacheDir=cacheDir, sizeLimit=cacheSizeLimit)
+            recordDict = cache.load(filePath)
+            if recordDict is not None:
+                self.__recordDict = recordDict
+                self.__recordIndex = {}
+                self.__keywordList = list(recordDict.keys())
+                return
+
+        self.__indexFile(filePath)
+
+        if useCache:
+            # 全ての配列レコードを変換してから保存
+            for key in list(self.__recordIndex.keys()):
+                self.giveValue(key)
+            # キーワードの順番はファイル中の順にして保存する
+            cache.store(filePath, {key: self.__recordDict[key] for key in self.__keywordList})
+
+    def __indexFile(self, filePath):
         """
+        ファイルを走査して単行レコードの値と配列レコードの索引を作る
+        """
+        # キーワード -> 値 (変換済みのもの)
+        recordDict = {}
+        # キーワード -> (valuetype, 要素数, データ開始位置, データのバイト数) (未変換の配列レコード)
+        recordIndex = {}
+        # ファイル中に出現する順のキーワード
+        keywordList = []
+
+        keywordLinePattern = re.compile(rb'^(.{42}) ([IRC]) (.+)$')
+
         # ファイル読み込み
-        with open(filePath, mode='r') as f:
-            try:
-                data = [s.strip('\n') for s in f.readlines()]
-            except UnicodeDecodeError as e:
-                # binaryではないか
-                print('Fchk file, {} may be a binary file'.format(filePath))
-                print(e)
-                exit()
-
-        # キーワードの出現する行数(index)を取得し、
-        # index間毎にdataを分割していく
-        keywordLineMatch = [re.match(r'^(.{42}) ([IRC]) (.+)$', line) for line in data]
-        keywordLineIndex = [i for i, match in enumerate(keywordLineMatch) if match is not None]
-        recordIndexRange = [[start, nextstart] for start,nextstart in zip(keywordLineIndex, keywordLineIndex[1:])]
-        recordIndexRange.append([keywordLineIndex[-1],len(data)])
-
-        # [[match object, 分割データ], [*, *], ....]
-        recordList = [[keywordLineMatch[start], data[start:nextstart]] for start, nextstart in recordIndexRange]
-
-        # キーワードの値を取得できるように辞書型に変換していく
-        def convertRecordToDict(record):
-            match = record[0]
-            recorddata = record[1]
-
-            keyword = match.group(1).strip(' ')
-            valuetype = match.group(2)
-            value = re.sub('.+ ', '', match.group(3))
-
-            if len(recorddata) == 1:
-                # 単行レコードの場合
-                if valuetype == 'R':
-                    value = float(value)
-                elif valuetype == 'I':
-                    value = int(value)
+        with open(filePath, mode='rb') as f:
+            offset = 0
+            while True:
+                line = f.readline()
+                if line == b'':
+                    break
+                offset += len(line)
+
+                match = keywordLinePattern.match(line.rstrip(b'\r\n'))
+                if match is None:
+                    # タイトル行など、キーワードを含まない行は読み飛ばす
+                    continue
+
+                try:
+                    keyword = match.group(1).decode().strip(' ')
+                    valuetype = match.group(2).decode()
+                    value = match.group(3).decode()
+                except UnicodeDecodeError as e:
+                    # binaryではないか
+                    print('Fchk file, {} may be a binary file'.format(filePath))
+                    print(e)
+                    exit()
+                keywordList.append(keyword)
+
+                if 'N=' not in value:
+                    # 単行レコードの場合
+                    value = re.sub('.+ ', '', value)
+                    if valuetype == 'R':
+                        value = float(value)
+                    elif valuetype == 'I':
+                        value = int(value)
+                    recordDict[keyword] = value
+                    continue
 
-            else:
                 # 複数行のレコードの場合
-                # valueには要素数(に相当するもの)が入っているため、recorddata[1:]で置換する
-                if valuetype == 'C':
-                    # レコードタイプがコメント(文字列)だった場合
-                    value = ''.join(recorddata[1:])
-                else:
-                    stringList = ' '.join(recorddata[1:]).split()
-                    if valuetype == 'R':
-                        value = [float(s) for s in stringList]
-                    else: # valuetype == 'I'
-                        value = [int(s) for s in stringList]
+                # valueには要素数が入っているので、その分の行を変換せずに読み飛ばす
+                numElement = int(re.sub('.+ ', '', value))
+                numPerLine, _ = self.__recordFormat[valuetype]
+                numLine = -(-numElement // numPerLine)
+                dataOffset = offset
+                for _ in range(numLine):
+                    offset += len(f.readline())
+                recordIndex[keyword] = (valuetype, numElement, dataOffset, offset - dataOffset)
 
-            return keyword, value
+        self.__recordDict = recordDict
+        self.__recordIndex = recordIndex
+        self.__keywordList = keywordList
 
-        # [(keyword, dict), (*, *), ....]
-        # -> {key1: dict1, key2: dict2, ....}
-        recordDict = dict([convertRecordToDict(record) for record in recordList])
+    def __readRecordData(self, key):
+        """
+        索引から配列レコードのデータ部分(bytes)を読み込む
+        """
+        _, _, dataOffset, dataSize = self.__recordIndex[key]
+        with open(self.__filePath, mode='rb') as f:
+            f.seek(dataOffset)
+            return f.read(dataSize)
 
-        self.__recordDict = recordDict
+    def __iterateRecordData(self, key, blockSize=1<<22):
+        """
+        配列レコードのデータ部分を、行の途中で切れないようにおよそblockSizeバイトずつ返す
+        """
+        _, _, dataOffset, dataSize = self.__recordIndex[key]
+        with open(self.__filePath, mode='rb') as f:
+            f.seek(dataOffset)
+            remain = dataSize
+            while remain > 0:
+                block = f.read(min(blockSize, remain))
+                if len(block) < remain and not block.endswith(b'\n'):
+                    block += f.readline()
+                if len(block) == 0:
+                    break
+                remain -= len(block)
+                yield block
+
+    def __decodeRecord(self, key):
+        """
+        索引から配列レコードを読み込み、np.ndarray(float64 or int64)か文字列に変換する
+        """
+        valuetype, numElement, _, _ = self.__recordIndex[key]
+
+        data = self.__readRecordData(key)
+        data = data.replace(b'\n', b'').replace(b'\r', b'')
 
+        if valuetype == 'C':
+            # レコードタイプがコメント(文字列)だった場合
+            return data.decode()
+
+        dtype = np.float64 if valuetype == 'R' else np.int64
+        _, width = self.__recordFormat[valuetype]
+        if len(data) == numElement * width:
+            # 固定幅(E16.8 or I12)の文字列として一括変換
+            return np.frombuffer(data, dtype='S{}'.format(width), count=numElement).astype(dtype)
+        else:
+            # 固定幅になっていない場合は空白区切りとして変換
+            return np.fromstring(data.decode(), dtype=dtype, sep=' ')
 
     def __devideList(self, targetList, ruleList):
         """
@@ -98,8 +191,11 @@ class Fchk:
         指定されたキーワードに対応する値を返す
 
         key: キーワード
-        return: 数値、または文字列、または数値のリスト
+        return: 数値、または文字列、またはnp.ndarray
         """
+        if key not in self.__recordDict and key in self.__recordIndex:
+            # 配列レコードは初めて要求された時に変換する
+            self.__recordDict[key] = self.__decodeRecord(key)
         return self.__recordDict.get(key, None)
 
     def containsRecord(self, key):
@@ -109,7 +205,94 @@ class Fchk:
         key: キーワード
         return: boolean
         """
-        return key in self.__recordDict.keys()
+        return key in self.__recordDict.keys() or key in self.__recordIndex.keys()
+
+    def giveKeywords(self):
+        """
+        fchkに含まれるキーワードのリストを返す (ファイル中に出現する順)
+        """
+        return list(self.__keywordList)
+
+    def writeJson(self, f, keywords=None, arrayDir=None, arrayPrefix=''):
+        """
+        レコードをJSON形式(キーワード -> 値のobject)で書き出す
+
+        1レコードずつ書き出すので、ファイル全体を文字列として持つことはない
+        数値の配列レコードは、fchk中の数値の文字列をそのままブロック単位でJSONの配列にする
+
+        f: 書き込み先 (テキストモードのファイルオブジェクト)
+        keywords: 書き出すキーワードのリスト (指定しない場合は全て)
+        arrayDir: 指定した場合、数値の配列レコードはarrayDirにバイナリ形式(.npy)で保存し、
+                  JSONには{"file": ファイルの絶対パス, "dtype": 型, "shape": 形状}を書く
+                  (JSONをどこに置いても読めるように、実行時のディレクトリからの相対パスではなく絶対パスにする)
+        arrayPrefix: .npyファイルの名前の接頭辞
+        """
+        if keywords is None:
+            keywords = self.giveKeywords()
+        else:
+            keywords = list(keywords)
+            notFound = [key for key in keywords if not self.containsRecord(key)]
+            if len(notFound) > 0:
+                raise ValueError('keyword not found: {}'.format(', '.join(notFound)))
+        if arrayDir is not None:
+            os.makedirs(arrayDir, exist_ok=True)
+
+        f.write('{\n')
+        for i, key in enumerate(keywords):
+            f.write('{} : '.format(json.dumps(key)))
+            self.__writeJsonValue(f, key, arrayDir, arrayPrefix)
+            f.write(',\n' if i < len(keywords) - 1 else '\n')
+        f.write('}\n')
+
+    def __writeJsonValue(self, f, key, arrayDir, arrayPrefix):
+        """
+        writeJsonの1レコード分の値を書き出す
+        """
+        if key in self.__recordIndex:
+            valuetype = self.__recordIndex[key][0]
+        elif isinstance(self.__recordDict[key], np.ndarray):
+            valuetype = 'R' if self.__recordDict[key].dtype.kind == 'f' else 'I'
+        else:
+            valuetype = None
+
+        if valuetype is None or valuetype == 'C':
+            # 単行レコードと文字列のレコード
+            value = self.__recordDict[key] if key in self.__recordDict else self.__decodeRecord(key)
+            if type(value) is str and key in self.__recordIndex:
+                value = value.strip(' ')
+            f.write(json.dumps(value))
+
+        elif arrayDir is not None:
+            # 数値の配列レコードはバイナリで保存する
+            value = self.__recordDict[key] if key in self.__recordDict else self.__decodeRecord(key)
+            fileName = arrayPrefix + re.sub(r'[^0-9A-Za-z]+', '_', key).strip('_') + '.npy'
+            filePath = os.path.abspath(os.path.join(arrayDir, fileName))
+            np.save(filePath, value)
+            f.write(json.dumps({'file': filePath, 'dtype': str(value.dtype), 'shape': list(value.shape)}))
+
+        elif key in self.__recordIndex:
+            # fchk中の数値の文字列はそのままJSONの数値として使える (E16.8 or I12)
+            f.write('[')
+            isFirst = True
+            for block in self.__iterateRecordData(key):
+                tokens = block.split()
+                if len(tokens) == 0:
+                    continue
+                if not isFirst:
+                    f.write(', ')
+                f.write(b', '.join(tokens).decode())
+                isFirst = False
+            f.write(']')
+
+        else:
+            # キャッシュから読み込んだ配列
+            value = self.__recordDict[key].ravel()
+            f.write('[')
+            for start in range(0, len(value), 65536):
+                if start > 0:
+                    f.write(', ')
+                f.write(', '.join(map(repr, value[start:start+65536].tolist())))
+            f.write(']')
 
     def giveRouteSection(self):
         # ルートセクション
@@ -285,6 +468,10 @@ class Fchk:
                 return 10
             elif st == -3:
                 return 7
+            elif st == 4:
+                return 15
+            elif st == -4:
+                return 9
             else:
                 raise ValueError('shell type:{} is unknown'.format(st))
 
@@ -306,17 +493,35 @@ class Fchk:
 
         return numBasisEachAtomId
 
-    def giveDensityMatrix(self):
+    def __convertTriangularToSymmetric(self, triangularList):
+        """
+        下三角部分を行毎に並べたリスト [a11, a21, a22, a31, ...] から対称行列を生成する
+        return: np.ndarray (shape: (n, n))
+        """
+        triangularList = np.asarray(triangularList)
+        n = int(round((np.sqrt(8*len(triangularList)+1)-1)/2))
+        if n*(n+1)//2 != len(triangularList):
+            raise ValueError('length of triangularList must be n(n+1)/2')
+
+        matrix = np.zeros([n, n])
+        matrix[np.tril_indices(n)] = triangularList
+        matrix = matrix + np.tril(matrix, k=-1).T
+
+        return matrix
+
+    def giveDensityMatrix(self, densityName='SCF'):
         """
         密度行列を返す
+        densityName: 'Total {densityName} Density'のレコードを読む (SCF, MP2, CC, CI, ...)
         return: np.ndarray (shape: (numBasis, numBasis))
         """
         # densityのリストを取得
-        densityList = self.giveValue('Spin SCF Density')
-        densityList = np.array(densityList)
+        key = 'Total {} Density'.format(densityName)
+        densityList = self.giveValue(key)
+        if densityList is None:
+            raise ValueError('Fchk does not contain the record, {}'.format(key))
         # 三角行列になっているので、元の対称行列に変形
-        densityMatrix = np.triu(squareform(densityList))[:-1,1:]
-        densityMatrix = densityMatrix + np.tril(densityMatrix.T, k=-1)
+        densityMatrix = self.__convertTriangularToSymmetric(densityList)
 
         return densityMatrix
 
@@ -345,10 +550,11 @@ class Fchk:
                 lmnList = [[1,0,0],[0,1,0],[0,0,1]]
             elif st == -1:
                 lmnList = [[0,0,0],[1,0,0],[0,1,0],[0,0,1]]
-            elif st == 2:
-                lmnList = [[2,0,0],[0,2,0],[0,0,2],[1,1,0],[1,0,1],[0,1,1]]
+            elif st >= 2:
+                lmnList = _cartesianPowers[st]
             else:
-                raise ValueError('not yet implemented')
+                # pureのshellはGTOBasisでは扱えないので、giveBasisSet()を使う
+                raise ValueError('pure shell type:{} is not supported by GTOBasis, use giveBasisSet()'.format(st))
 
             if st == -1:
                 # contraction修正
@@ -361,59 +567,236 @@ class Fchk:
 
         return basisFuncList
 
-    def calcElectronDensity(self, r):
+    def giveBasisSet(self):
+        """
+        全ての基底関数を一括で評価するBasisSetインスタンスを返す
+        """
+        return BasisSet(
+            self.giveValue('Shell types'),
+            self.giveValue('Number of primitives per shell'),
+            self.giveValue('Primitive exponents'),
+            self.giveValue('Contraction coefficients'),
+            self.giveValue('P(S=P) Contraction coefficients'),
+            self.giveValue('Coordinates of each shell')
+        )
+
+    def calcElectronDensity(self, r, spin=False, densityName='SCF', threshold=1e-10):
         """
         指定された座標における電子密度を計算
+        rho(r) = sum_{mu,nu} chi_mu(r) D_{mu,nu} chi_nu(r)
         r: 電子密度を計算する座標(単位: Bohr): np.ndarray: shape:(*,3) or (3,)
+        spin: Trueの場合はスピン密度を計算
+        densityName: 使用する密度行列 (giveDensityMatrixを参照)
+        threshold: 寄与がこの値未満になるshellの組は計算から除く (BasisSet.calcDensityを参照)
         return: np.ndarray: shape:(*,)
         """
-        # 基底関数インスタンスのリストを取得
-        basisFuncList = self.giveBasisFuncs()
-        # 軌道係数を取得
-        numAlphaElec = self.giveNumAlphaElectrons()
-        numBetaElec  = self.giveNumBetaElectrons()
-        alphaOrbitalCoeffs, betaOrbitalCoeffs = self.giveOrbitalCoeffList(merge=False)
-        orbitalCoeffs = np.vstack([alphaOrbitalCoeffs[:numAlphaElec], betaOrbitalCoeffs[:numBetaElec]]) # shape: (numElec, numBasis)
-
-        # 各点で基底関数を評価
-        basisFuncValue = np.array([f.calc(r) for f in basisFuncList]) # shape: (numBasis, numPoint)
-        # 各点で分子軌道を評価
-        moValue = orbitalCoeffs @ basisFuncValue # shape: (numElec, numPoint)
+        # 基底関数を取得
+        basisSet = self.giveBasisSet()
+        # 密度行列を取得
+        if spin:
+            densityMatrix = self.giveSpinDensityMatrix(densityName=densityName)
+        else:
+            densityMatrix = self.giveDensityMatrix(densityName=densityName)
+
         # 密度計算
-        densitydata = np.sum(moValue**2, axis=0) # shape: (numPoint,)
+        densitydata = basisSet.calcDensity(r, densityMatrix, threshold=threshold) # shape: (numPoint,)
 
         return densitydata
 
-    def giveElectronDensityCube(self):
+    def __giveGridSpec(self, startingPoint, stepVector, numGridPoint, margin, step):
+        """
+        cubeの格子を決める
+        startingPoint, stepVector, numGridPointが全て指定された場合はそれを使い、
+        指定されていない場合は原子核座標をmarginだけ広げた範囲をstep間隔の直交格子で覆う
+        (単位: Bohr)
+        return: startingPoint (shape: (3,)), stepVector (shape: (3,3)), numGridPoint (shape: (3,))
+        """
+        specified = [v is not None for v in [startingPoint, stepVector, numGridPoint]]
+        if all(specified):
+            startingPoint = np.array(startingPoint, dtype=np.float64)
+            stepVector = np.array(stepVector, dtype=np.float64)
+            numGridPoint = np.array(numGridPoint, dtype=np.int64)
+            if startingPoint.shape != (3,) or stepVector.shape != (3,3) or numGridPoint.shape != (3,):
+                raise ValueError('shape of startingPoint, stepVector, numGridPoint must be (3,), (3,3), (3,)')
+            return startingPoint, stepVector, numGridPoint
+        elif any(specified):
+            raise ValueError('startingPoint, stepVector and numGridPoint must be specified together')
+
+        if margin < 0 or step <= 0:
+            raise ValueError('margin must be non-negative and step must be positive')
+        coords = self.giveCoords()
+        lower = np.min(coords, axis=0) - margin
+        upper = np.max(coords, axis=0) + margin
+        numGridPoint = np.ceil((upper - lower) / step).astype(np.int64) + 1
+        # 原子核座標の中心が格子の中心になるように調整
+        startingPoint = (lower + upper) / 2 - (numGridPoint - 1) * step / 2
+        stepVector = np.diag([step, step, step]).astype(np.float64)
+
+        return startingPoint, stepVector, numGridPoint
+
+    def __calcCubeData(self, kernel, valueDim, startingPoint, stepVector, numGridPoint, chunkSize, numProcess):
+        """
+        格子点をchunkSize毎に分け、kernel.calc()で値を計算する
+        numProcess > 1 の場合はプロセスプールで並列に計算する
+        return: np.ndarray (shape: (na, nb, nc, valueDim))
+        """
+        if type(chunkSize) is not int or chunkSize < 1:
+            raise ValueError('chunkSize must be a positive int')
+        if type(numProcess) is not int or numProcess < 1:
+            raise ValueError('numProcess must be a positive int')
+
+        numPoint = int(np.prod(numGridPoint))
+        cubeData = np.empty((numPoint, valueDim))
+        chunkList = [(start, min(start+chunkSize, numPoint)) for start in range(0, numPoint, chunkSize)]
+        gridSpec = (startingPoint, stepVector, numGridPoint)
+
+        if numProcess == 1:
+            # 呼び出し元のプロセスではモジュールの変数を使わない (スレッドから同時に呼ばれても混ざらないように)
+            for start, stop in chunkList:
+                cubeData[start:stop] = _calcGrid(kernel, gridSpec, start, stop)
+        else:
+            # kernel(基底関数や係数)は各プロセスの初期化時に1回だけ渡す
+            with ProcessPoolExecutor(max_workers=numProcess, initializer=_initGridWorker, initargs=(kernel, gridSpec)) as executor:
+                for (start, stop), values in zip(chunkList, executor.map(_calcGridChunk, chunkList)):
+                    cubeData[start:stop] = values
+
+        return cubeData.reshape(*numGridPoint, valueDim)
+
+    def giveElectronDensityCube(self, startingPoint=None, stepVector=None, numGridPoint=None, margin=5.0, step=0.2, spin=False, densityName='SCF', threshold=1e-10, chunkSize=65536, numProcess=1):
         """
         電子密度のcubeデータを生成
+
+        startingPoint, stepVector, numGridPoint: 格子 (単位: Bohr, Cube(cubeData=...)と同じ形式)
+            指定しない場合は原子核座標をmarginだけ広げた範囲をstep間隔の直交格子で覆う
+        spin, densityName, threshold: calcElectronDensityを参照
+        chunkSize: 一度に計算する格子点の数
+        numProcess: 並列に計算するプロセス数
         return: Cubeインスタンス
         """
         # 格子点設定
-        # TODO
-        gridcoord = np.arange(300000).reshape(-1,3)
-        densitydata = self.calcElectronDensity(gridcoord)
-        cube = Cube()
+        startingPoint, stepVector, numGridPoint = self.__giveGridSpec(startingPoint, stepVector, numGridPoint, margin, step)
+
+        # 密度計算
+        if spin:
+            densityMatrix = self.giveSpinDensityMatrix(densityName=densityName)
+        else:
+            densityMatrix = self.giveDensityMatrix(densityName=densityName)
+        kernel = _DensityKernel(self.giveBasisSet(), densityMatrix, threshold)
+        densitydata = self.__calcCubeData(kernel, 1, startingPoint, stepVector, numGridPoint, chunkSize, numProcess)
+
+        cube = Cube(
+            startingPoint=startingPoint,
+            stepVector=stepVector,
+            numGridPoint=numGridPoint,
+            cubeData=densitydata,
+            valueNames=['spin density' if spin else 'density'],
+            atomicNumData=self.giveAtomicNums(),
+            atomXYZData=self.giveCoords()
+        )
 
         return cube
 
-    def giveSpinDensityMatrix(self):
+    def __parseOrbitalSelection(self, orbital):
+        """
+        軌道の指定を(spin, 軌道のindex(0始まり), 名前)に変換する
+        orbital: int (alpha軌道のindex)
+               : str ('HOMO', 'LUMO', 'HOMO-1', 'LUMO+2', ... (alpha軌道))
+               : tuple or list (('alpha' or 'beta', intかstr), 例: ('beta', 'HOMO-1'))
+        """
+        if type(orbital) in [tuple, list]:
+            if len(orbital) != 2 or orbital[0] not in ['alpha', 'beta']:
+                raise ValueError('orbital must be (\'alpha\' or \'beta\', int or str)')
+            spin, orbital = orbital
+        else:
+            spin = 'alpha'
+
+        alphaEnergies, betaEnergies = self.giveOrbitalEnergyList(merge=False)
+        if spin == 'alpha':
+            numOrbital = len(alphaEnergies)
+            homoIndex = self.giveNumAlphaElectrons() - 1
+        else:
+            numOrbital = len(betaEnergies)
+            homoIndex = self.giveNumBetaElectrons() - 1
+
+        if type(orbital) in [int, np.int32, np.int64]:
+            index = int(orbital)
+            name = '{} {}'.format(spin, index)
+        elif type(orbital) is str:
+            match = re.match(r'^(HOMO|LUMO)(([+-])([0-9]+))?$', orbital)
+            if match is None:
+                raise ValueError('invalid orbital name: {}'.format(orbital))
+            index = homoIndex if match.group(1) == 'HOMO' else homoIndex + 1
+            if match.group(2) is not None:
+                index += int(match.group(2))
+            name = '{} {} ({})'.format(spin, index, orbital)
+        else:
+            raise TypeError('type of orbital must be int, str, tuple or list')
+
+        if index < 0 or index >= numOrbital:
+            raise ValueError('orbital index {} is out of range (0-{})'.format(index, numOrbital-1))
+
+        return spin, index, name
+
+    def giveOrbitalCube(self, orbitals, startingPoint=None, stepVector=None, numGridPoint=None, margin=5.0, step=0.2, chunkSize=65536, numProcess=1):
+        """
+        複数の分子軌道のcubeデータを1回の格子点計算で生成
+        基底関数の値は格子点のchunk毎に1回だけ計算し、指定された軌道の係数をまとめて掛ける
+
+        orbitals: 軌道の指定のリスト (例: ['HOMO', 'LUMO', ('beta', 'HOMO-1'), 10])
+                  int: alpha軌道のindex(0始まり), str: 'HOMO', 'LUMO+1', ... (alpha軌道)
+                  tuple: ('alpha' or 'beta', intかstr)
+        startingPoint, stepVector, numGridPoint, margin, step, chunkSize, numProcess:
+            giveElectronDensityCubeを参照
+        return: Cubeインスタンス (valueDim == len(orbitals))
+        """
+        if type(orbitals) not in [list, tuple] or len(orbitals) == 0:
+            raise ValueError('orbitals must be a non-empty list')
+
+        # 格子点設定
+        startingPoint, stepVector, numGridPoint = self.__giveGridSpec(startingPoint, stepVector, numGridPoint, margin, step)
+
+        # 指定された軌道の係数を取り出す
+        alphaCoeffs, betaCoeffs = self.giveOrbitalCoeffList(merge=False)
+        selectedCoeffs = []
+        valueNames = []
+        for orbital in orbitals:
+            spin, index, name = self.__parseOrbitalSelection(orbital)
+            selectedCoeffs.append(alphaCoeffs[index] if spin == 'alpha' else betaCoeffs[index])
+            valueNames.append(name)
+        selectedCoeffs = np.array(selectedCoeffs) # shape: (numOrbital, numBasis)
+
+        kernel = _OrbitalKernel(self.giveBasisSet(), selectedCoeffs)
+        orbitaldata = self.__calcCubeData(kernel, len(orbitals), startingPoint, stepVector, numGridPoint, chunkSize, numProcess)
+
+        cube = Cube(
+            startingPoint=startingPoint,
+            stepVector=stepVector,
+            numGridPoint=numGridPoint,
+            cubeData=orbitaldata,
+            valueDim=len(orbitals),
+            valueNames=valueNames,
+            atomicNumData=self.giveAtomicNums(),
+            atomXYZData=self.giveCoords()
+        )
+
+        return cube
+
+    def giveSpinDensityMatrix(self, densityName='SCF'):
         """
         スピン密度行列を返す
+        densityName: 'Spin {densityName} Density'のレコードを読む (SCF, MP2, CC, CI, ...)
         return: np.ndarray (shape: (numBasis, numBasis))
         """
         # spin densityのリストを取得
-        spinDensityList = self.giveValue('Spin SCF Density')
+        spinDensityList = self.giveValue('Spin {} Density'.format(densityName))
         if spinDensityList is None:
             # 制限付き計算の場合等
             numBasis = self.giveNumBasis()
             spinDensityMatrix = np.zeros([numBasis, numBasis])
             return spinDensityMatrix
 
-        spinDensityList = np.array(spinDensityList)
         # 三角行列になっているので、元の対称行列に変形
-        spinDensityMatrix = np.triu(squareform(spinDensityList))[:-1,1:]
-        spinDensityMatrix = spinDensityMatrix + np.tril(spinDensityMatrix.T, k=-1)
+        spinDensityMatrix = self.__convertTriangularToSymmetric(spinDensityList)
 
         return spinDensityMatrix
 
@@ -424,12 +807,12 @@ class Fchk:
 
         # まず、FCHKからxyz形式を得る
         # 原子番号のリストを取得
-        atomicNums = self.giveValue('Atomic numbers')
+        atomicNums = self.giveValue('Atomic numbers').tolist()
 
         # 座標リストを取得
         coords = self.giveValue('Current cartesian coordinates')
         # 単位をa.u.からangstromに変換する
-        coords = [0.529177210903 * c for c in coords]
+        coords = (0.529177210903 * coords).tolist()
         # [x,y,z]の配列に変換
         coords = [[x,y,z] for x,y,z in zip(coords[0::3],coords[1::3],coords[2::3])]
 
@@ -448,3 +831,69 @@ class Fchk:
             return mols[0]
 
 
+class _DensityKernel:
+    """
+    格子点上で電子密度を計算する (Fchk.giveElectronDensityCube用)
+    """
+    def __init__(self, basisSet, densityMatrix, threshold):
+        self.basisSet = basisSet
+        self.densityMatrix = densityMatrix
+        self.threshold = threshold
+
+    def calc(self, r):
+        """
+        r: shape: (numPoint, 3)
+        return: shape: (numPoint, 1)
+        """
+        return self.basisSet.calcDensity(r, self.densityMatrix, threshold=self.threshold)[:,np.newaxis]
+
+
+class _OrbitalKernel:
+    """
+    格子点上で複数の分子軌道の値を計算する (Fchk.giveOrbitalCube用)
+    """
+    def __init__(self, basisSet, orbitalCoeffs, chunkSize=4096):
+        self.basisSet = basisSet
+        self.orbitalCoeffs = orbitalCoeffs
+        self.chunkSize = chunkSize
+
+    def calc(self, r):
+        """
+        r: shape: (numPoint, 3)
+        return: shape: (numPoint, numOrbital)
+        """
+        result = np.empty((len(r), len(self.orbitalCoeffs)))
+        # 基底関数の値の配列が大きくなりすぎないように分割して計算
+        for start in range(0, len(r), self.chunkSize):
+            basisFuncValue = self.basisSet.calc(r[start:start+self.chunkSize]) # shape: (numBasis, numPoint)
+            result[start:start+self.chunkSize] = (self.orbitalCoeffs @ basisFuncValue).T
+        return result
+
+
+# 格子点の計算を行うプロセスが保持するデータ
+_gridWorkerKernel = None
+_gridWorkerSpec = None
+
+def _initGridWorker(kernel, gridSpec):
+    global _gridWorkerKernel, _gridWorkerSpec
+    _gridWorkerKernel = kernel
+    _gridWorkerSpec = gridSpec
+
+def _calcGridChunk(chunk):
+    """
+    プロセスプールの各プロセスで、_initGridWorker()で渡されたデータを使って_calcGrid()を行う
+    chunk: (start, stop)
+    """
+    start, stop = chunk
+    return _calcGrid(_gridWorkerKernel, _gridWorkerSpec, start, stop)
+
+def _calcGrid(kernel, gridSpec, start, stop):
+    """
+    格子点の通し番号がstart~stop-1の範囲の値を計算する
+    gridSpec: (startingPoint, stepVector, numGridPoint)
+    return: shape: (stop-start, valueDim)
+    """
+    startingPoint, stepVector, numGridPoint = gridSpec
+    index = np.stack(np.unravel_index(np.arange(start, stop), numGridPoint), axis=1) # shape: (stop-start, 3)
+    r = startingPoint + index @ stepVector
+    return kernel.calc(r)
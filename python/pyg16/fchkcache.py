@@ -0,0 +1,128 @@
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+
+import numpy as np
+
+class FchkCache:
+    """
+    Fchkのレコードをバイナリ形式(.npy)でキャッシュするクラス
+
+    キャッシュはcacheDir以下に、fchkファイル毎に1つのディレクトリとして保存する
+    - キー: fchkファイルの絶対パス、サイズ、更新時刻
+    - records.json: 単行レコードと文字列レコードの値、配列レコードの.npyファイル名、キーワードの順番
+    - *.npy: 配列レコード (読み込み時はnp.memmapとして開く)
+    キャッシュ全体のサイズがsizeLimitを超えた場合は、最後に使われたのが古いものから削除する(LRU)
+    """
+    def __init__(self, cacheDir=None, sizeLimit=None):
+        """
+        cacheDir: キャッシュの保存先
+                  (指定しない場合は環境変数PYG16_CACHE_DIR、それもなければ~/.cache/pyg16/fchk)
+        sizeLimit: キャッシュ全体のサイズの上限(byte) (デフォルト: 4GiB)
+        """
+        if cacheDir is None:
+            cacheDir = os.environ.get('PYG16_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'pyg16', 'fchk'))
+        if sizeLimit is None:
+            sizeLimit = 4 * 1024**3
+        if type(sizeLimit) is not int or sizeLimit < 0:
+            raise ValueError('sizeLimit must be a non-negative int')
+
+        self.__cacheDir = cacheDir
+        self.__sizeLimit = sizeLimit
+
+    def __giveEntryDir(self, filePath):
+        """
+        fchkファイルに対応するキャッシュのディレクトリを返す
+        """
+        stat = os.stat(filePath)
+        key = '{}\0{}\0{}'.format(os.path.abspath(filePath), stat.st_size, stat.st_mtime_ns)
+        return os.path.join(self.__cacheDir, hashlib.sha1(key.encode()).hexdigest())
+
+    def load(self, filePath):
+        """
+        キャッシュからレコードを読み込む
+        return: {keyword: value} (配列はnp.memmap), キャッシュが存在しない場合はNone
+        """
+        entryDir = self.__giveEntryDir(filePath)
+        indexPath = os.path.join(entryDir, 'records.json')
+        if not os.path.isfile(indexPath):
+            return None
+
+        with open(indexPath, mode='r') as f:
+            index = json.load(f)
+
+        recordDict = dict(index['values'])
+        for keyword, arrayFile in index['arrays'].items():
+            recordDict[keyword] = np.load(os.path.join(entryDir, arrayFile), mmap_mode='r')
+        # 保存時のキーワードの順番に戻す
+        recordDict = {keyword: recordDict[keyword] for keyword in index.get('keywords', list(recordDict.keys()))}
+
+        # LRUのために使用時刻を更新
+        os.utime(entryDir)
+
+        return recordDict
+
+    def store(self, filePath, recordDict):
+        """
+        レコードをキャッシュに保存し、上限を超えた分を削除する
+        recordDict: {keyword: value} (キーワードの順番も保存する)
+        """
+        entryDir = self.__giveEntryDir(filePath)
+        os.makedirs(self.__cacheDir, exist_ok=True)
+
+        # 書き込み途中のキャッシュが読まれないように、一時ディレクトリに書いてから移動する
+        tempDir = tempfile.mkdtemp(dir=self.__cacheDir, prefix='.tmp')
+        try:
+            index = {'values': {}, 'arrays': {}, 'keywords': list(recordDict.keys())}
+            for i, (keyword, value) in enumerate(recordDict.items()):
+                if isinstance(value, np.ndarray):
+                    arrayFile = '{}.npy'.format(i)
+                    np.save(os.path.join(tempDir, arrayFile), value)
+                    index['arrays'][keyword] = arrayFile
+                else:
+                    index['values'][keyword] = value
+            with open(os.path.join(tempDir, 'records.json'), mode='w') as f:
+                json.dump(index, f)
+
+            if os.path.isdir(entryDir):
+                shutil.rmtree(entryDir)
+            os.rename(tempDir, entryDir)
+        except Exception:
+            shutil.rmtree(tempDir, ignore_errors=True)
+            raise
+
+        self.evict(keep=entryDir)
+
+    def evict(self, keep=None):
+        """
+        キャッシュ全体のサイズがsizeLimit以下になるまで、最後に使われたのが古いものから削除する
+        keep: 削除しないキャッシュのディレクトリ
+        """
+        if not os.path.isdir(self.__cacheDir):
+            return
+
+        entryList = []
+        for name in os.listdir(self.__cacheDir):
+            entryDir = os.path.join(self.__cacheDir, name)
+            if name.startswith('.') or not os.path.isdir(entryDir):
+                continue
+            size = sum(os.path.getsize(os.path.join(entryDir, fileName)) for fileName in os.listdir(entryDir))
+            entryList.append([os.path.getmtime(entryDir), size, entryDir])
+
+        totalSize = sum(size for _, size, _ in entryList)
+        for _, size, entryDir in sorted(entryList):
+            if totalSize <= self.__sizeLimit:
+                break
+            if entryDir == keep:
+                continue
+            shutil.rmtree(entryDir, ignore_errors=True)
+            totalSize -= size
+
+    def clear(self):
+        """
+        キャッシュを全て削除する
+        """
+        if os.path.isdir(self.__cacheDir):
+            shutil.rmtree(self.__cacheDir)
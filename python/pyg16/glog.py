@@ -0,0 +1,532 @@
+import os
+import re
+import glob
+
+import numpy as np
+
+from pyg16.element import giveElementTable
+
+class GaussianLog:
+    """
+    Gaussianのlogファイルから値を取り出すクラス
+
+    ファイルは1回だけ読み込み、各セクション(SCF Done, 軌道エネルギー, 熱化学, Link1によるジョブの区切り, ...)の
+    行番号の索引を作る
+    各値はgive...()で要求された時に、索引の行だけを解釈して求める
+    """
+    # 索引を作る行のパターン (名前 -> パターンのリスト)
+    # 全パターンを1つのalternationにまとめて、ファイルを1回だけ走査する
+    # reは全候補がリテラルで始まる場合だけ先頭の文字で位置を読み飛ばせるので、各パターンはリテラルで始める
+    # (行頭の空白(^ +)が必要なものは__lineHeadNamesに入れ、索引を作る時に確認する)
+    __patternDict = {
+        'link1': [rb'Link1: +Proceeding to internal job step number'],
+        'standardOrientation': [rb'Standard orientation: *\r?$'],
+        'inputOrientation': [rb'Input orientation: *\r?$'],
+        'optCompleted': [rb'Optimization completed'],
+        'ircPoint': [rb'Point Number: +\d+ +Path Number: +\d+'],
+        'natoms': [rb'NAtoms='],
+        'electrons': [rb'alpha electrons +\d+ beta electrons'],
+        'chargeMultiplicity': [rb'Charge = +-?\d+ Multiplicity = +\d+'],
+        'stoichiometry': [rb'Stoichiometry'],
+        'standardBasis': [rb'Standard basis:'],
+        'basisFunctions': [rb'basis functions, +\d+ primitive gaussians'],
+        'scfDone': [rb'SCF Done:'],
+        'eigenvalues': [rb'Alpha +(?:occ|virt)\. eigenvalues', rb'Beta +(?:occ|virt)\. eigenvalues'],
+        'zpve': [rb'Zero-point correction='],
+        'sumZPVE': [rb'Sum of electronic and zero-point Energies='],
+        'sumThermal': [rb'Sum of electronic and thermal Energies='],
+        'sumFree': [rb'Sum of electronic and thermal Free Energies='],
+        'temperature': [rb'Temperature +\S+ +Kelvin'],
+        'optStep': [rb'Step number +\d+ out of a maximum of'],
+        'imFreq': [rb'\*\*\*\*\*\*.+imaginary frequencies.+\*{6}'],
+        'scrdir': [rb'scrdir'],
+        # ' PID='と同じ (空白で始めると候補の位置が多すぎるので後読みで確認する)
+        'pid': [rb'PID=(?<= PID=)'],
+        'banner': [rb'\*\** *$'],
+        'cpuTime': [rb'Job cpu time'],
+        'elapsedTime': [rb'Elapsed time'],
+        # 異常終了の判定に使う行
+        'failSCFConvergence': [rb'Convergence criterion not met'],
+        'failOptimization': [rb'Optimization stopped'],
+        'smallInteratomicDistance': [rb'Small interatomic distances encountered'],
+        'FormBXProblem': [rb'FormBX had a problem', rb'Linear angle in Tors', rb'Linear angle in Bend', rb'Error in internal coordinate system'],
+        'NotEnoughMaxDisk': [rb'Transformation cannot fit in the specified MaxDisk\.', rb'Not enough resources for E2 calculation\.'],
+    }
+    __lineHeadNames = {'standardOrientation', 'inputOrientation', 'banner'}
+
+    # 各パターンの末尾に空のグループ(_0, _1, ...)を付け、一致したパターンをm.lastgroupで判別する
+    __groupNames = {'_{}'.format(i): name for i, name in enumerate(name for name, patterns in __patternDict.items() for _ in patterns)}
+    __pattern = re.compile(b'|'.join(b'%s(?P<_%d>)' % (pattern, i) for i, pattern in enumerate(pattern for patterns in __patternDict.values() for pattern in patterns)), re.M)
+
+    # 時間の表記 (例: 0 days  0 hours  1 minutes 23.4 seconds.)
+    __timePattern = re.compile(r'(\d+) +days +(\d+) +hours +(\d+) +minutes +([\d.]+) +seconds')
+
+    def __init__(self, filePath, job=None):
+        """
+        filePath: logファイル
+        job: 対象とするジョブの番号(1始まり、Link1で区切られたもの)
+             指定しない場合はファイル全体を対象にする(各値は最後に出現したものを使う)
+        """
+        with open(filePath, mode='rb') as f:
+            self.__data = f.read()
+        self.__filePath = filePath
+
+        # 各行の開始位置
+        byteArray = np.frombuffer(self.__data, dtype=np.uint8)
+        self.__lineStart = np.concatenate([[0], np.flatnonzero(byteArray == ord('\n')) + 1])
+        self.__numLine = len(self.__lineStart) if self.__lineStart[-1] < len(self.__data) else len(self.__lineStart) - 1
+
+        # パターン -> 該当する行番号の配列
+        offsetDict = {name: [] for name in self.__patternDict}
+        for m in self.__pattern.finditer(self.__data):
+            offsetDict[self.__groupNames[m.lastgroup]].append(m.start())
+        self.__index = {}
+        for name, offsets in offsetDict.items():
+            lineNumbers = np.searchsorted(self.__lineStart, offsets, side='right') - 1
+            if name in self.__lineHeadNames:
+                # 行頭から一致した位置までが1文字以上の空白だけのもの (^ +)
+                lineNumbers = [i for i, offset in zip(lineNumbers, offsets)
+                               if offset > self.__lineStart[i] and self.__data[self.__lineStart[i]:offset].strip(b' ') == b'']
+            self.__index[name] = np.unique(np.asarray(lineNumbers, dtype=np.int64))
+
+        # 閉じる区切り線まで出力されていない(途中で切れた)座標の表は構造に数えず、別の索引に移す
+        # (強制終了したIRCやスキャンのlogなど)
+        for name in ['standardOrientation', 'inputOrientation']:
+            isComplete = np.array([self.__giveTableRange(header) is not None for header in self.__index[name]], dtype=bool)
+            self.__index[name + 'Incomplete'] = self.__index[name][~isComplete]
+            self.__index[name] = self.__index[name][isComplete]
+
+        # ジョブの区切り (各ジョブの開始行)
+        self.__jobStart = np.concatenate([[0], self.__index['link1']]).astype(np.int64)
+        self.setJob(job)
+
+        self.__orbitalEnergyCache = None
+
+    def giveNumJob(self):
+        """
+        ジョブ(Link1で区切られたもの)の数を返す
+        """
+        return len(self.__jobStart)
+
+    def setJob(self, job=None):
+        """
+        対象とするジョブを設定する (Noneの場合はファイル全体)
+        """
+        if job is None:
+            self.__lineRange = (0, self.__numLine)
+        else:
+            if type(job) is not int or job < 1 or job > self.giveNumJob():
+                raise ValueError('job must be int between 1 and {}'.format(self.giveNumJob()))
+            stop = self.__jobStart[job] if job < self.giveNumJob() else self.__numLine
+            self.__lineRange = (int(self.__jobStart[job-1]), int(stop))
+        self.__orbitalEnergyCache = None
+
+    def giveLine(self, lineNumber):
+        """
+        lineNumber行目(0始まり)の文字列を返す (改行は含まない)
+        """
+        start = self.__lineStart[lineNumber]
+        stop = self.__lineStart[lineNumber+1] - 1 if lineNumber + 1 < len(self.__lineStart) else len(self.__data)
+        return self.__data[start:stop].decode(errors='replace').rstrip('\r')
+
+    def giveLineNumbers(self, name):
+        """
+        索引のうち、対象のジョブの範囲に含まれる行番号を返す
+        name: 索引の名前 (__patternDictのキー)
+        """
+        lineNumbers = self.__index[name]
+        start, stop = self.__lineRange
+        return lineNumbers[(lineNumbers >= start) & (lineNumbers < stop)]
+
+    def __giveLastLine(self, name):
+        lineNumbers = self.giveLineNumbers(name)
+        if len(lineNumbers) == 0:
+            return None
+        return self.giveLine(lineNumbers[-1])
+
+    def __giveFirstLine(self, name):
+        lineNumbers = self.giveLineNumbers(name)
+        if len(lineNumbers) == 0:
+            return None
+        return self.giveLine(lineNumbers[0])
+
+    def __searchLastLine(self, name, pattern, group=1, type=str):
+        """
+        索引nameの最後の行からpatternで値を取り出す (見つからない場合はNone)
+        """
+        line = self.__giveLastLine(name)
+        if line is None:
+            return None
+        m = re.search(pattern, line)
+        if m is None:
+            return None
+        return type(m.group(group))
+
+    def giveNumAtom(self):
+        return self.__searchLastLine('natoms', r'NAtoms= +(\d+)', type=int)
+
+    def giveNumAlphaElectron(self):
+        return self.__searchLastLine('electrons', r'(\d+) alpha electrons', type=int)
+
+    def giveNumBetaElectron(self):
+        return self.__searchLastLine('electrons', r'(\d+) beta electrons', type=int)
+
+    def giveNumElectron(self):
+        numAlpha = self.giveNumAlphaElectron()
+        numBeta = self.giveNumBetaElectron()
+        if numAlpha is None or numBeta is None:
+            return None
+        return numAlpha + numBeta
+
+    def giveCharge(self):
+        return self.__searchLastLine('chargeMultiplicity', r'Charge = +(-?\d+)', type=int)
+
+    def giveMultiplicity(self):
+        return self.__searchLastLine('chargeMultiplicity', r'Multiplicity = +(\d+)', type=int)
+
+    def giveStoichiometry(self):
+        return self.__searchLastLine('stoichiometry', r'Stoichiometry +(\S+)')
+
+    def giveBasis(self):
+        return self.__searchLastLine('standardBasis', r'Standard basis: *(.*?) *$')
+
+    def giveNumBasis(self):
+        return self.__searchLastLine('basisFunctions', r'(\d+) basis functions', type=int)
+
+    def giveNumPrimitiveBasis(self):
+        return self.__searchLastLine('basisFunctions', r'(\d+) primitive gaussians', type=int)
+
+    def giveNumCartesianBasis(self):
+        return self.__searchLastLine('basisFunctions', r'(\d+) cartesian basis functions', type=int)
+
+    def isUnrestricted(self):
+        """
+        Beta軌道の軌道エネルギーが出力されているか
+        """
+        return any(['Beta' in self.giveLine(i) for i in self.giveLineNumbers('eigenvalues')])
+
+    def giveSCFEnergy(self, asString=False):
+        """
+        最後のSCFエネルギー (Born-Oppenheimer近似での全エネルギー)
+        asString: Trueの場合はfloatに変換せず、logに書かれている文字列(桁数)のまま返す (以下のエネルギー等も同様)
+        """
+        return self.__searchLastLine('scfDone', r'= +(\S+) +A\.U\.', type=str if asString else float)
+
+    def giveOrbitalEnergies(self, spin='Alpha'):
+        """
+        最後に出力された軌道エネルギーを返す
+        spin: 'Alpha', 'Beta', 'Both' (Both: AlphaとBetaを合わせたもの)
+              閉殻計算でBetaを指定した場合はAlphaと同じ値を返す
+        return: 占有軌道のエネルギー, 仮想軌道のエネルギー (np.ndarray, 昇順)
+        """
+        if spin not in ['Alpha', 'Beta', 'Both']:
+            raise ValueError('spin must be \'Alpha\', \'Beta\', or \'Both\'')
+
+        if self.__orbitalEnergyCache is None:
+            lineNumbers = self.giveLineNumbers('eigenvalues')
+            energyDict = {(s, o): [] for s in ['Alpha', 'Beta'] for o in ['occ', 'virt']}
+            if len(lineNumbers) > 0:
+                # 最後の連続した行のまとまりを使う
+                blockStart = np.flatnonzero(np.diff(lineNumbers) != 1)
+                lastBlock = lineNumbers[blockStart[-1]+1:] if len(blockStart) > 0 else lineNumbers
+                for i in lastBlock:
+                    line = self.giveLine(i)
+                    head, values = line.split('--', 1)
+                    values = values[1:].rstrip()
+                    # 値は10文字ずつ並んでいる(値同士がつながっている場合もある)
+                    energyList = [float(values[j:j+10]) for j in range(0, len(values), 10)]
+                    energyDict[(head.split()[0], head.split()[1].rstrip('.'))].extend(energyList)
+            if len(energyDict[('Beta', 'occ')]) == 0 and len(energyDict[('Beta', 'virt')]) == 0:
+                energyDict[('Beta', 'occ')] = energyDict[('Alpha', 'occ')]
+                energyDict[('Beta', 'virt')] = energyDict[('Alpha', 'virt')]
+            self.__orbitalEnergyCache = {key: np.sort(value) for key, value in energyDict.items()}
+
+        cache = self.__orbitalEnergyCache
+        if spin == 'Both':
+            return np.sort(np.concatenate([cache[('Alpha', 'occ')], cache[('Beta', 'occ')]])), \
+                    np.sort(np.concatenate([cache[('Alpha', 'virt')], cache[('Beta', 'virt')]]))
+        return cache[(spin, 'occ')].copy(), cache[(spin, 'virt')].copy()
+
+    def giveOrbitalEnergy(self, orbitalName, spin='Alpha'):
+        """
+        orbitalNameで指定した軌道のエネルギーを返す
+        orbitalName: 'all', 'occall', 'virtall' (np.ndarray), 'HOMO', 'HOMO1', 'HOMO2', ..., 'LUMO', 'LUMO1', ... (float)
+                     HOMOn: 上からn番目の占有軌道, LUMOn: 下からn番目の仮想軌道
+        return: 該当する軌道がない場合はNone
+        """
+        occ, virt = self.giveOrbitalEnergies(spin)
+        if orbitalName == 'all':
+            return np.sort(np.concatenate([occ, virt]))
+        elif orbitalName == 'occall':
+            return occ
+        elif orbitalName == 'virtall':
+            return virt
+
+        m = re.fullmatch(r'(HOMO|LUMO)(\d*)', orbitalName)
+        if m is None:
+            raise ValueError('invalid orbital name: {}'.format(orbitalName))
+        pos = int(m.group(2)) if m.group(2) else 1
+        if pos < 1:
+            raise ValueError('invalid orbital name: {}'.format(orbitalName))
+        if m.group(1) == 'HOMO':
+            return occ[-pos] if pos <= len(occ) else None
+        else:
+            return virt[pos-1] if pos <= len(virt) else None
+
+    def giveZPVE(self, asString=False):
+        """
+        ゼロ点振動エネルギー
+        """
+        return self.__searchLastLine('zpve', r'= +(\S+)', type=str if asString else float)
+
+    def giveTotalZPVEEnergy(self, asString=False):
+        """
+        全エネルギー + ゼロ点振動エネルギー
+        """
+        return self.__searchLastLine('sumZPVE', r'= +(\S+)', type=str if asString else float)
+
+    def giveInternalEnergy(self, asString=False):
+        return self.__searchLastLine('sumThermal', r'= +(\S+)', type=str if asString else float)
+
+    def giveGibbsEnergy(self, asString=False):
+        return self.__searchLastLine('sumFree', r'= +(\S+)', type=str if asString else float)
+
+    def giveTemperature(self, asString=False):
+        line = self.__giveFirstLine('temperature')
+        if line is None:
+            return None
+        value = re.search(r'Temperature +(\S+) +Kelvin', line).group(1)
+        return value if asString else float(value)
+
+    def givePressure(self, asString=False):
+        line = self.__giveFirstLine('temperature')
+        m = None if line is None else re.search(r'Pressure +(\S+) +Atm', line)
+        if m is None:
+            return None
+        return m.group(1) if asString else float(m.group(1))
+
+    def giveTotalOptStep(self):
+        """
+        構造最適化のステップ数
+        """
+        return len(self.giveLineNumbers('optStep'))
+
+    def giveNumImaginaryFreq(self):
+        return self.__searchLastLine('imFreq', r'(\d+) +imaginary frequencies', type=int)
+
+    def giveScrFilesPath(self):
+        """
+        計算に使われたスクラッチファイル(.inp, .rwf, .d2e, .int, ...)のうち、存在し、自分が所有しているもののパスを返す
+        """
+        scrLine = self.__giveFirstLine('scrdir')
+        pidLine = self.__giveFirstLine('pid')
+        if scrLine is None or pidLine is None:
+            return []
+        inpFilePath = re.sub(r' *-scrdir=.+', '', scrLine).split(' ')[-1].replace('"', '')
+        pid = re.sub(r'[^0-9]', '', pidLine.split(' ')[-1])
+
+        # .d2e, .rwf, .intなどのファイル名は、.inpのファイル名の末尾の番号をPIDに置き換えたもの
+        otherFilePathPattern = re.sub(r'-[^-]+$', '-{}.'.format(pid), inpFilePath)
+        pathList = glob.glob(glob.escape(inpFilePath)) + sorted(glob.glob(glob.escape(otherFilePathPattern) + '*'))
+        return [path for path in pathList if os.stat(path).st_uid == os.getuid()]
+
+    def giveVersion(self):
+        """
+        Gaussianのバージョン (例: ES64L-G16RevC.01)
+        """
+        lineNumbers = self.__index['banner']
+        if len(lineNumbers) == 0:
+            return None
+        for i in range(lineNumbers[0], min(lineNumbers[0]+10, self.__numLine)):
+            line = self.giveLine(i)
+            if 'gaussian' in line.lower():
+                m = re.search(r'^[^:]+: +(\S+)', line)
+                return None if m is None else m.group(1)
+        return None
+
+    def giveExitStatus(self):
+        """
+        終了状態を返す
+        return: list of str (正常終了の場合は['Normal termination'])
+        """
+        # 最後の4行にNormal terminationもError terminationもない場合は途中で終了している
+        start, stop = self.__lineRange
+        lastLines = []
+        i = stop - 1
+        while i >= start and len(lastLines) < 4:
+            line = self.giveLine(i)
+            if len(lastLines) > 0 or line.strip() != '':
+                lastLines.append(line)
+            i -= 1
+        if not any(['Normal termination' in line or 'Error termination' in line for line in lastLines]):
+            return ['gaussianExitsSuddenly']
+
+        errorList = [name for name in ['failSCFConvergence', 'failOptimization', 'smallInteratomicDistance', 'FormBXProblem', 'NotEnoughMaxDisk']
+                        if len(self.giveLineNumbers(name)) > 0]
+        if len(errorList) == 0:
+            return ['Normal termination']
+        return errorList
+
+    def __giveTimes(self, name):
+        timeList = []
+        for i in self.giveLineNumbers(name):
+            m = self.__timePattern.search(self.giveLine(i))
+            if m is not None:
+                days, hours, minutes, seconds = m.groups()
+                timeList.append(int(days)*86400 + int(hours)*3600 + int(minutes)*60 + float(seconds))
+        return timeList
+
+    def giveCpuTimes(self):
+        """
+        各ジョブステップのCPU時間(秒)のリスト
+        """
+        return self.__giveTimes('cpuTime')
+
+    def giveElapsedTimes(self):
+        """
+        各ジョブステップの経過時間(秒)のリスト
+        """
+        return self.__giveTimes('elapsedTime')
+
+    def __giveOrientationName(self, orientation):
+        """
+        orientation: 'standard', 'input', None (Standard orientationがあればそれ、なければInput orientation)
+        return: 索引の名前
+        """
+        if orientation is None:
+            return 'standardOrientation' if len(self.giveLineNumbers('standardOrientation')) > 0 else 'inputOrientation'
+        if orientation not in ['standard', 'input']:
+            raise ValueError('orientation must be \'standard\', \'input\', or None')
+        return orientation + 'Orientation'
+
+    def giveNumGeometry(self, orientation=None):
+        """
+        logに出力された構造(Standard/Input orientation)の数を返す (途中で切れた表は含まない)
+        """
+        return len(self.giveLineNumbers(self.__giveOrientationName(orientation)))
+
+    def giveNumIncompleteGeometry(self, orientation=None):
+        """
+        途中で切れていて構造に数えなかった座標の表の数を返す
+        """
+        return len(self.giveLineNumbers(self.__giveOrientationName(orientation) + 'Incomplete'))
+
+    def __giveTableRange(self, header):
+        """
+        headerの行から始まる座標の表の範囲(バイト位置)を返す (表が途中で切れている場合はNone)
+        ヘッダー(orientation, 区切り線, 列名2行, 区切り線)の後から次の区切り線までが座標の表
+         Center     Atomic      Atomic             Coordinates (Angstroms)
+         Number     Number       Type             X           Y           Z
+              1          6           0       -2.235209    0.056525    0.069806
+        """
+        if header + 5 >= self.__numLine:
+            return None
+        tableStart = self.__lineStart[header+5]
+        tableStop = self.__data.find(b' ---', tableStart)
+        if tableStop < 0:
+            return None
+        return tableStart, tableStop
+
+    def giveGeometry(self, step, orientation=None):
+        """
+        step番目(1始まり、負の場合は後ろから)に出力された構造を返す
+        索引の位置から該当する表だけを読む
+
+        return: 原子番号 (shape: (numAtom,)), 座標 (shape: (numAtom, 3), 単位: Angstrom)
+        """
+        lineNumbers = self.giveLineNumbers(self.__giveOrientationName(orientation))
+        if type(step) is not int or step == 0 or abs(step) > len(lineNumbers):
+            raise IndexError('step must be between 1 and {} (or negative)'.format(len(lineNumbers)))
+        # 索引には閉じた表だけが入っている
+        tableStart, tableStop = self.__giveTableRange(lineNumbers[step-1 if step > 0 else step])
+        rows = [line.split() for line in self.__data[tableStart:tableStop].decode().splitlines() if line.strip() != '']
+        atomicNums = np.array([int(row[1]) for row in rows], dtype=np.int64)
+        coords = np.array([row[-3:] for row in rows], dtype=np.float64).reshape(-1, 3)
+        return atomicNums, coords
+
+    def giveGeometries(self, orientation=None):
+        """
+        logに出力された全ての構造を返す (IRCや座標スキャンのように原子数が変わらないもの)
+        return: 原子番号 (shape: (numAtom,)), 座標 (shape: (numGeometry, numAtom, 3), 単位: Angstrom)
+        """
+        numGeometry = self.giveNumGeometry(orientation)
+        if numGeometry == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros((0, 0, 3))
+        atomicNums, coords = self.giveGeometry(1, orientation)
+        coordList = [coords] + [self.giveGeometry(step, orientation)[1] for step in range(2, numGeometry+1)]
+        return atomicNums, np.stack(coordList)
+
+    def giveGeometryInfo(self, orientation=None, asString=False):
+        """
+        各構造の情報を返す
+        その構造の後(次の構造の前まで、ただしLink1で区切られた次のジョブには跨がない)に出力された
+        SCFエネルギー、構造最適化のステップ番号、スキャンの点の番号、IRCの点の番号を対応させる
+        asString: Trueの場合はSCFエネルギーをlogに書かれている文字列のまま返す
+
+        return: list of dict (キー: 'step', 'line', 'energy', 'optStep', 'scanPoint', 'ircPoint', 'ircPath', 値がない場合はNone)
+        """
+        lineNumbers = self.giveLineNumbers(self.__giveOrientationName(orientation))
+        nextLineNumbers = np.append(lineNumbers[1:], self.__lineRange[1])
+        # 各構造のジョブの終わり(次のLink1)で打ち切る
+        jobStop = np.append(self.__jobStart[1:], self.__numLine)[np.searchsorted(self.__jobStart, lineNumbers, side='right') - 1]
+        nextLineNumbers = np.minimum(nextLineNumbers, jobStop)
+
+        def giveFollowingLines(name):
+            # 各構造について、次の構造までの間にある最後の行
+            targetLines = self.giveLineNumbers(name)
+            index = np.searchsorted(targetLines, nextLineNumbers) - 1
+            isFollowing = (index >= 0) & (targetLines[np.maximum(index, 0)] >= lineNumbers) if len(targetLines) > 0 else np.zeros(len(lineNumbers), dtype=bool)
+            return [self.giveLine(targetLines[i]) if f else None for i, f in zip(index, isFollowing)]
+
+        def search(line, pattern, type):
+            m = None if line is None else re.search(pattern, line)
+            return None if m is None else type(m.group(1))
+
+        infoList = []
+        for step, (lineNumber, scfLine, optLine, ircLine) in enumerate(zip(lineNumbers, giveFollowingLines('scfDone'), giveFollowingLines('optStep'), giveFollowingLines('ircPoint')), start=1):
+            infoList.append({
+                'step': step,
+                'line': int(lineNumber),
+                'energy': search(scfLine, r'= +(\S+) +A\.U\.', str if asString else float),
+                'optStep': search(optLine, r'Step number +(\d+)', int),
+                'scanPoint': search(optLine, r'scan point +(\d+)', int),
+                'ircPoint': search(ircLine, r'Point Number: +(\d+)', int),
+                'ircPath': search(ircLine, r'Path Number: +(\d+)', int),
+            })
+        return infoList
+
+    def giveOptGeometryStep(self, orientation=None):
+        """
+        構造最適化の結果の構造の番号と、最適化が完了したか('opt')、失敗したか('nonopt')を返す
+        (最適化の終了メッセージの後に最初に出力された構造、なければその直前の構造)
+        return: step, status (構造最適化の終了メッセージがない場合はNone, None)
+        """
+        completedLines = self.giveLineNumbers('optCompleted')
+        stoppedLines = self.giveLineNumbers('failOptimization')
+        if len(completedLines) == 0 and len(stoppedLines) == 0:
+            return None, None
+        # 最初に出現した終了メッセージを使う
+        if len(stoppedLines) == 0 or (len(completedLines) > 0 and completedLines[0] < stoppedLines[0]):
+            endLine, status = completedLines[0], 'opt'
+        else:
+            endLine, status = stoppedLines[0], 'nonopt'
+
+        lineNumbers = self.giveLineNumbers(self.__giveOrientationName(orientation))
+        if len(lineNumbers) == 0:
+            return None, status
+        step = int(np.searchsorted(lineNumbers, endLine)) + 1
+        if step > len(lineNumbers):
+            step = len(lineNumbers)
+        return step, status
+
+    def giveXYZ(self, step, orientation=None, comment=''):
+        """
+        step番目の構造をxyz形式の文字列で返す
+        """
+        atomicNums, coords = self.giveGeometry(step, orientation)
+        lines = [str(len(atomicNums)), comment]
+        elementTable = giveElementTable()
+        # 原子番号0はゴースト原子
+        symbols = ['X' if n == 0 else elementTable.giveSymbol(int(n)) for n in atomicNums]
+        lines += ['{} {:.6f} {:.6f} {:.6f}'.format(symbol, *xyz) for symbol, xyz in zip(symbols, coords)]
+        return '\n'.join(lines) + '\n'